@@ -9,20 +9,54 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
-from typing import Dict, Any
-
-from ue_project_utils import find_uproject_file, read_uproject
-from install_plugin import get_source_version, get_installed_version, compare_versions
+from typing import Dict, Any, List
+
+from ue_project_utils import (
+    dumps_json,
+    find_uproject_file,
+    index_plugins,
+    is_file,
+    is_port_open,
+    load_json,
+    read_uproject,
+    scan_dir,
+)
+from install_plugin import (
+    compare_versions,
+    get_installed_version,
+    get_source_version,
+    installed_plugin_dir,
+)
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
+# Health probe timeout as (connect, read) seconds
+HEALTH_TIMEOUT = (1, 2)
+
+
+def _create_session() -> "requests.Session":
+    """Create a keep-alive session shared by all health probes."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=2,
+        # No read retries: a hung editor should fail within one read timeout
+        max_retries=Retry(total=2, read=0, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _create_session() if HAS_REQUESTS else None
+
 
 def check_status(project_dir: str) -> Dict[str, Any]:
     """
@@ -47,17 +81,19 @@ def check_status(project_dir: str) -> Dict[str, Any]:
         "details": {}
     }
 
-    # Check plugin directory
+    # Check plugin directory (one directory read covers the top-level entries)
     plugin_dir = project_path / "Plugins" / "UnrealPythonREST"
-    result["details"]["plugin_dir_exists"] = plugin_dir.is_dir()
+    entries = scan_dir(plugin_dir)
+    result["details"]["plugin_dir_exists"] = entries is not None
+    entries = entries or {}
 
     # Check .uplugin file
-    uplugin_file = plugin_dir / "UnrealPythonREST.uplugin"
-    result["details"]["uplugin_exists"] = uplugin_file.is_file()
+    uplugin_entry = entries.get("UnrealPythonREST.uplugin")
+    result["details"]["uplugin_exists"] = uplugin_entry is not None and uplugin_entry.is_file()
 
     # Check source files
     build_cs = plugin_dir / "Source" / "UnrealPythonREST" / "UnrealPythonREST.Build.cs"
-    result["details"]["source_exists"] = build_cs.is_file()
+    result["details"]["source_exists"] = "Source" in entries and is_file(build_cs)
 
     result["installed"] = all([
         result["details"]["plugin_dir_exists"],
@@ -65,11 +101,13 @@ def check_status(project_dir: str) -> Dict[str, Any]:
         result["details"]["source_exists"]
     ])
 
-    # Check versions
-    result["installed_version"] = get_installed_version(project_path)
+    # Check versions (skip the VERSION.json read when nothing is installed;
+    # the installer's location differs from the legacy directory probed above)
     result["source_version"] = get_source_version()
-    comparison = compare_versions(result["installed_version"], result["source_version"])
-    result["update_available"] = comparison == "update_available"
+    if installed_plugin_dir(project_path).is_dir():
+        result["installed_version"] = get_installed_version(project_path)
+        comparison = compare_versions(result["installed_version"], result["source_version"])
+        result["update_available"] = comparison == "update_available"
 
     # Check .uproject for plugin enablement
     uproject_path = find_uproject_file(project_path)
@@ -77,11 +115,8 @@ def check_status(project_dir: str) -> Dict[str, Any]:
         try:
             uproject = read_uproject(uproject_path)
 
-            plugins = uproject.get("Plugins", [])
-            for plugin in plugins:
-                if plugin.get("Name") == "UnrealPythonREST":
-                    result["enabled"] = plugin.get("Enabled", False)
-                    break
+            plugins = index_plugins(uproject.get("Plugins", []))
+            result["enabled"] = plugins.get("UnrealPythonREST", {}).get("Enabled", False)
 
             result["details"]["uproject_found"] = True
         except Exception:
@@ -89,26 +124,23 @@ def check_status(project_dir: str) -> Dict[str, Any]:
 
     # Check config file for running server
     config_file = project_path / "Saved" / "UnrealPythonREST.json"
-    if config_file.is_file():
-        try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-
-            port = config.get("port")
-            result["server_port"] = port
-            result["details"]["config_exists"] = True
-
-            # Try to ping server
-            if HAS_REQUESTS and port:
-                try:
-                    response = requests.get(f"http://localhost:{port}/api/v1/health", timeout=2)
-                    result["server_running"] = response.status_code == 200
-                except Exception:
-                    result["server_running"] = False
-
-        except Exception:
-            result["details"]["config_exists"] = False
-    else:
+    # A missing or unreadable file lands in the except branch (no separate stat)
+    try:
+        config = load_json(config_file)
+
+        port = config.get("port")
+        result["server_port"] = port
+        result["details"]["config_exists"] = True
+
+        # Try to ping server
+        if HAS_REQUESTS and port and is_port_open(port):
+            try:
+                response = _SESSION.get(f"http://localhost:{port}/api/v1/health", timeout=HEALTH_TIMEOUT)
+                result["server_running"] = response.status_code == 200
+            except Exception:
+                result["server_running"] = False
+
+    except Exception:
         result["details"]["config_exists"] = False
 
     return result
@@ -116,58 +148,62 @@ def check_status(project_dir: str) -> Dict[str, Any]:
 
 def print_status(status: Dict[str, Any]):
     """Print status in readable format."""
-    print("\n" + "=" * 60)
-    print("UnrealPythonREST Plugin Status")
-    print("=" * 60)
+    out: List[str] = []
+    out.append("\n" + "=" * 60)
+    out.append("UnrealPythonREST Plugin Status")
+    out.append("=" * 60)
 
     # Installation status
     if status["installed"]:
-        print("  [!] Plugin installed")
+        out.append("  [!] Plugin installed")
     else:
-        print("  [X] Plugin NOT installed")
+        out.append("  [X] Plugin NOT installed")
         for key, value in status["details"].items():
             if not value and key.endswith("_exists"):
-                print(f"      Missing: {key.replace('_exists', '').replace('_', ' ')}")
+                out.append(f"      Missing: {key.replace('_exists', '').replace('_', ' ')}")
 
     # Version status
     installed_version = status.get("installed_version")
     source_version = status.get("source_version")
     if installed_version:
-        print(f"  [i] Installed version: {installed_version}")
+        out.append(f"  [i] Installed version: {installed_version}")
     if source_version:
-        print(f"  [i] Source version: {source_version}")
+        out.append(f"  [i] Source version: {source_version}")
     if status.get("update_available"):
-        print(f"  [!] Update available: {installed_version} -> {source_version}")
+        out.append(f"  [!] Update available: {installed_version} -> {source_version}")
     elif installed_version and source_version and installed_version == source_version:
-        print("  [=] Up to date")
+        out.append("  [=] Up to date")
 
     # Enablement status
     if status["enabled"]:
-        print("  [!] Plugin enabled in .uproject")
+        out.append("  [!] Plugin enabled in .uproject")
     else:
-        print("  [X] Plugin NOT enabled in .uproject")
+        out.append("  [X] Plugin NOT enabled in .uproject")
 
     # Server status
     if status["server_running"]:
-        print(f"  [!] REST server running on port {status['server_port']}")
+        out.append(f"  [!] REST server running on port {status['server_port']}")
     elif status["details"].get("config_exists"):
-        print(f"  [o] Config exists but server not responding (port {status['server_port']})")
-        print("      Editor may not be running")
+        out.append(f"  [o] Config exists but server not responding (port {status['server_port']})")
+        out.append("      Editor may not be running")
     else:
-        print("  [o] REST server not running (no config file)")
+        out.append("  [o] REST server not running (no config file)")
 
-    print("=" * 60)
+    out.append("=" * 60)
 
     # Summary
     if status["installed"] and status["enabled"] and status["server_running"]:
-        print("Status: READY - Full REST API available")
+        out.append("Status: READY - Full REST API available")
     elif status["installed"] and status["enabled"]:
-        print("Status: INSTALLED - Open editor to start REST server")
+        out.append("Status: INSTALLED - Open editor to start REST server")
     elif status["installed"]:
-        print("Status: PARTIAL - Plugin installed but not enabled")
+        out.append("Status: PARTIAL - Plugin installed but not enabled")
     else:
-        print("Status: NOT INSTALLED - Run /install-ue-rest to install")
-    print()
+        out.append("Status: NOT INSTALLED - Run /install-ue-rest to install")
+    out.append("")
+
+    # Emit in a single write
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -182,7 +218,7 @@ def main():
     status = check_status(args.project_dir)
 
     if args.json:
-        print(json.dumps(status, indent=2))
+        print(dumps_json(status))
     else:
         print_status(status)
 
@@ -15,12 +15,22 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Dict, Any, List, Tuple, Optional
 
-from ue_project_utils import find_uproject_file_with_reason, read_uproject, write_uproject
+from ue_project_utils import (
+    find_uproject_file_with_reason,
+    index_plugins,
+    is_file,
+    load_json,
+    read_uproject,
+    write_uproject,
+)
 
 # Plugin source location (in skill assets directory)
 PLUGIN_SOURCE = Path(__file__).resolve().parent.parent.parent
@@ -31,29 +41,41 @@ REQUIRED_PLUGINS = ["PythonScriptPlugin", "UnrealBridgeREST"]
 # Version tracking
 VERSION_FILE = "VERSION.json"
 
+# Worker threads for concurrent file checks
+VERIFY_WORKERS = 4
+
+# Worker threads for copying plugin files
+COPY_WORKERS = 8
+
+# Entries excluded when copying the plugin
+_IGNORE_EXACT = frozenset({".git", "__pycache__"})
+_IGNORE_PREFIX = ".git"
+_IGNORE_SUFFIX = (".pyc",)
+
 
 def read_plugin_version(plugin_dir: Path) -> Optional[Dict[str, Any]]:
     """Read VERSION.json from plugin directory."""
-    version_path = plugin_dir / VERSION_FILE
-    if not version_path.exists():
-        return None
     try:
-        with open(version_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json(plugin_dir / VERSION_FILE)
     except (json.JSONDecodeError, OSError):
         return None
 
 
+@lru_cache(maxsize=1)
 def get_source_version() -> Optional[str]:
-    """Get version string from source plugin."""
+    """Get version string from source plugin (cached; the source path is fixed)."""
     info = read_plugin_version(PLUGIN_SOURCE)
     return info.get("version") if info else None
 
 
+def installed_plugin_dir(project_dir: Path) -> Path:
+    """Get the plugin install location inside a project."""
+    return project_dir / "Plugins" / "UnrealBridgeREST"
+
+
 def get_installed_version(project_dir: Path) -> Optional[str]:
     """Get version string from installed plugin in project."""
-    plugin_dir = project_dir / "Plugins" / "UnrealBridgeREST"
-    info = read_plugin_version(plugin_dir)
+    info = read_plugin_version(installed_plugin_dir(project_dir))
     return info.get("version") if info else None
 
 
@@ -106,40 +128,108 @@ class InstallResult:
                 pass  # Best effort
 
 
-def write_uproject_with_backup(path: Path, data: Dict[str, Any], backup: bool = True) -> Optional[Path]:
-    """Write .uproject with optional backup."""
-    backup_path = None
-    if backup:
-        backup_path = path.with_suffix('.uproject.backup')
-        shutil.copy2(path, backup_path)
-    write_uproject(path, data)
+def backup_uproject(path: Path) -> Path:
+    """Copy the original .uproject bytes to a sibling backup file."""
+    backup_path = path.with_suffix('.uproject.backup')
+    shutil.copy2(path, backup_path)
     return backup_path
 
 
-def ensure_plugin_enabled(uproject_data: Dict[str, Any], plugin_name: str) -> bool:
-    """Ensure plugin is enabled in .uproject data. Returns True if modified."""
+def ensure_plugin_enabled(
+    uproject_data: Dict[str, Any],
+    plugin_name: str,
+    index: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> bool:
+    """
+    Ensure plugin is enabled in .uproject data. Returns True if modified.
+
+    Pass an index from index_plugins() when enabling several plugins so the
+    list is only scanned once; it is kept up to date when an entry is added.
+    """
     if "Plugins" not in uproject_data:
         uproject_data["Plugins"] = []
 
     plugins = uproject_data["Plugins"]
-
-    # Check if already enabled
-    for plugin in plugins:
-        if plugin.get("Name") == plugin_name:
-            if plugin.get("Enabled", False):
-                return False  # Already enabled
-            else:
-                plugin["Enabled"] = True
-                return True
+    if index is None:
+        index = index_plugins(plugins)
+
+    # Check if already enabled (entry is mutated in place to keep list order)
+    plugin = index.get(plugin_name)
+    if plugin is not None:
+        if plugin.get("Enabled", False):
+            return False  # Already enabled
+        plugin["Enabled"] = True
+        return True
 
     # Add new plugin entry
-    plugins.append({
+    entry = {
         "Name": plugin_name,
         "Enabled": True
-    })
+    }
+    plugins.append(entry)
+    index[plugin_name] = entry
     return True
 
 
+def _ignore_copy_entries(directory: str, names: List[str]) -> List[str]:
+    """Return names to skip when copying the plugin (copytree ignore signature)."""
+    return [
+        n for n in names
+        if n in _IGNORE_EXACT or n.startswith(_IGNORE_PREFIX) or n.endswith(_IGNORE_SUFFIX)
+    ]
+
+
+def _parallel_copytree(
+    src: Path,
+    dst: Path,
+    ignore: Optional[Callable[[str, List[str]], Any]] = None,
+    workers: int = COPY_WORKERS,
+) -> None:
+    """
+    Copy a directory tree, creating directories serially and copying files concurrently.
+
+    Files are copied with shutil.copy2 (which uses the platform's fast copy
+    path and falls back on its own); directory metadata is copied last, as
+    shutil.copytree does.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (must not exist)
+        ignore: Optional callable with shutil.copytree's ignore signature
+        workers: Number of copy threads
+    """
+    pairs: List[Tuple[str, str]] = []
+    dir_pairs: List[Tuple[str, str]] = [(str(src), str(dst))]
+    os.makedirs(dst)
+    for dirpath, dirnames, filenames in os.walk(src, followlinks=True):
+        if ignore is not None:
+            ignored = set(ignore(dirpath, dirnames + filenames))
+            dirnames[:] = [d for d in dirnames if d not in ignored]
+            filenames = [f for f in filenames if f not in ignored]
+
+        target_dir = os.path.join(dst, os.path.relpath(dirpath, src))
+        for name in dirnames:
+            os.makedirs(os.path.join(target_dir, name), exist_ok=True)
+            dir_pairs.append((os.path.join(dirpath, name), os.path.join(target_dir, name)))
+        for name in filenames:
+            pairs.append((os.path.join(dirpath, name), os.path.join(target_dir, name)))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consume results so the first copy error propagates
+        list(executor.map(lambda pair: shutil.copy2(*pair), pairs))
+
+    # After the files, so their creation doesn't overwrite directory mtimes
+    for src_dir, dst_dir in dir_pairs:
+        shutil.copystat(src_dir, dst_dir)
+
+
+def _restore_backup(backup_path: Path, dest: Path) -> None:
+    """Put a backed-up plugin back in place, discarding any partial copy."""
+    shutil.rmtree(dest, ignore_errors=True)
+    # shutil.move renames, or copies when the backup is on another device
+    shutil.move(str(backup_path), str(dest))
+
+
 def copy_plugin(source: Path, dest: Path, result: InstallResult) -> Tuple[bool, Optional[Path]]:
     """
     Copy plugin directory to project Plugins folder.
@@ -155,17 +245,20 @@ def copy_plugin(source: Path, dest: Path, result: InstallResult) -> Tuple[bool,
             saved_dir = dest.parent.parent / "Saved" / "PluginBackups"
             saved_dir.mkdir(parents=True, exist_ok=True)
             backup_path = saved_dir / (dest.name + ".backup")
-            if backup_path.exists():
-                shutil.rmtree(backup_path)
-            shutil.move(str(dest), str(backup_path))
-            result.add_rollback(lambda bp=backup_path, d=dest: shutil.move(str(bp), str(d)))
+            # Same filesystem (both under the project), so a rename is enough
+            try:
+                os.replace(dest, backup_path)
+            except OSError:
+                # A stale backup blocks the rename (directories are only
+                # replaced when empty); anything else, such as Saved/ on
+                # another device, is left to shutil.move's copy fallback
+                if backup_path.exists():
+                    shutil.rmtree(backup_path)
+                shutil.move(str(dest), str(backup_path))
+            result.add_rollback(lambda bp=backup_path, d=dest: _restore_backup(bp, d))
 
         # Copy plugin (exclude .git)
-        shutil.copytree(
-            source,
-            dest,
-            ignore=shutil.ignore_patterns('.git', '.git*', '*.pyc', '__pycache__')
-        )
+        _parallel_copytree(source, dest, ignore=_ignore_copy_entries)
 
         result.add_step("Copy plugin", True, f"Copied to {dest}")
         return True, backup_path
@@ -181,14 +274,14 @@ def update_uproject_file(uproject_path: Path, result: InstallResult) -> bool:
         # Read current content
         data = read_uproject(uproject_path)
 
-        # Backup and enable plugins
-        backup_path = write_uproject_with_backup(uproject_path, data, backup=True)
-        if backup_path:
-            result.add_rollback(lambda bp=backup_path, up=uproject_path: shutil.copy2(bp, up))
+        # Backup original, then enable plugins and write once
+        backup_path = backup_uproject(uproject_path)
+        result.add_rollback(lambda bp=backup_path, up=uproject_path: shutil.copy2(bp, up))
 
+        index = index_plugins(data.setdefault("Plugins", []))
         modified = False
         for plugin_name in REQUIRED_PLUGINS:
-            if ensure_plugin_enabled(data, plugin_name):
+            if ensure_plugin_enabled(data, plugin_name, index):
                 modified = True
                 result.add_step(f"Enable {plugin_name}", True, "Added to .uproject")
             else:
@@ -206,7 +299,7 @@ def update_uproject_file(uproject_path: Path, result: InstallResult) -> bool:
 
 def verify_installation(project_dir: Path, result: InstallResult) -> bool:
     """Verify plugin installation is complete."""
-    plugin_dir = project_dir / "Plugins" / "UnrealBridgeREST"
+    plugin_dir = installed_plugin_dir(project_dir)
 
     # Check plugin files exist
     required_files = [
@@ -215,10 +308,13 @@ def verify_installation(project_dir: Path, result: InstallResult) -> bool:
         "Source/UnrealPythonREST/Public/UnrealPythonREST.h",
     ]
 
+    # Stat concurrently so cold-cache lookups after the copy overlap
+    with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as executor:
+        checks = list(executor.map(lambda p: (p, is_file(plugin_dir / p)), required_files))
+
     all_exist = True
-    for rel_path in required_files:
-        full_path = plugin_dir / rel_path
-        if full_path.exists():
+    for rel_path, exists in checks:
+        if exists:
             result.add_step(f"Verify {rel_path}", True)
         else:
             result.add_step(f"Verify {rel_path}", False, "File missing")
@@ -268,8 +364,8 @@ def install_plugin(project_dir: str, dry_run: bool = False, force: bool = False,
     result.add_step("Check plugin source", True, str(PLUGIN_SOURCE))
 
     # Destination
-    plugins_dir = project_path / "Plugins"
-    plugin_dest = plugins_dir / "UnrealBridgeREST"
+    plugin_dest = installed_plugin_dir(project_path)
+    plugins_dir = plugin_dest.parent
 
     # Check if already installed
     if plugin_dest.exists():
@@ -338,49 +434,54 @@ def install_plugin(project_dir: str, dry_run: bool = False, force: bool = False,
 
 def print_result(result: InstallResult, quiet: bool = False):
     """Print installation result in a readable format."""
+    out: List[str] = []
     if quiet:
         # Only print errors and final status
         failed_steps = [s for s in result.steps if not s[1]]
         for name, _, message in failed_steps:
-            print(f"ERROR: {name} - {message}")
+            out.append(f"ERROR: {name} - {message}")
 
         if result.success:
-            print("Installation complete!")
+            out.append("Installation complete!")
         else:
-            print("Installation failed.")
+            out.append("Installation failed.")
+        sys.stdout.write("\n".join(out) + "\n")
         return
 
     # Verbose output (default behavior)
-    print("\n" + "=" * 60)
-    print("UnrealBridgeREST Plugin Installation")
-    print("=" * 60)
+    out.append("\n" + "=" * 60)
+    out.append("UnrealBridgeREST Plugin Installation")
+    out.append("=" * 60)
 
     for name, success, message in result.steps:
         status = "[OK]  " if success else "[FAIL]"
         msg = f" - {message}" if message else ""
-        print(f"  {status} {name}{msg}")
+        out.append(f"  {status} {name}{msg}")
 
     if result.warnings:
-        print("\nWarnings:")
+        out.append("\nWarnings:")
         for warning in result.warnings:
-            print(f"  ! {warning}")
+            out.append(f"  ! {warning}")
 
-    print("=" * 60)
+    out.append("=" * 60)
     if result.success:
-        print("Installation complete!")
+        out.append("Installation complete!")
 
         # Show version info if available
         source_version = get_source_version()
         if source_version:
-            print(f"\nInstalled version: {source_version}")
+            out.append(f"\nInstalled version: {source_version}")
 
-        print("\nNext steps:")
-        print("  1. Open the project in Unreal Editor")
-        print("  2. Plugin will auto-enable on first launch")
-        print("  3. REST API available at http://localhost:8080/api/v1/")
+        out.append("\nNext steps:")
+        out.append("  1. Open the project in Unreal Editor")
+        out.append("  2. Plugin will auto-enable on first launch")
+        out.append("  3. REST API available at http://localhost:8080/api/v1/")
     else:
-        print("Installation failed. See errors above.")
-    print()
+        out.append("Installation failed. See errors above.")
+    out.append("")
+
+    # Emit in a single write
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -19,15 +19,32 @@ from __future__ import annotations
 import argparse
 import io
 import json
+import os
+import stat
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-# Force UTF-8 output on Windows to handle Unicode symbols
-if sys.platform == "win32":
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+# Force UTF-8 output on Windows to handle Unicode symbols (skipped when the
+# console or PYTHONUTF8 already provides UTF-8)
+if sys.platform == "win32" and (sys.stdout.encoding or "").lower().replace("-", "") != "utf8":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace', line_buffering=True)
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace', line_buffering=True)
+
+# Worker threads for running independent checks concurrently
+TEST_WORKERS = 8
+
+# Job completion polling (seconds)
+JOB_POLL_DEADLINE = 5.0
+JOB_POLL_INITIAL_DELAY = 0.02
+JOB_POLL_MAX_DELAY = 0.2
+JOB_ACTIVE_STATUSES = ("pending", "running")
+
+# Keys the execute response may use for the job id, in order of preference
+_JOB_ID_KEYS = ("job_id", "jobId", "id")
 
 # Test result symbols (ASCII-safe alternatives for Windows compatibility)
 SYM_PASS = "[PASS]"
@@ -37,24 +54,132 @@ SYM_SKIP = "[SKIP]"
 # Optional: requests for direct HTTP tests
 try:
     import requests
+    import urllib3
+    from requests.adapters import HTTPAdapter
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
+# (connect, read) timeouts in seconds: a dead localhost server fails the
+# connect budget immediately, while execute calls keep a generous read budget
+HEALTH_TIMEOUT = (0.2, 1.0)
+REQUEST_TIMEOUT = (0.5, 10.0)
+
+
+def _create_session() -> "requests.Session":
+    """Create a keep-alive session shared by every HTTP test."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount("http://", adapter)
+    return session
+
 # Import our client (handle import from same directory)
 try:
-    from ue_rest_client import UnrealExecutor
+    from ue_rest_client import UnrealExecutor, clear_discovery_cache
     HAS_CLIENT = True
 except ImportError:
     # Try relative import when run as script
-    import os
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
     try:
-        from ue_rest_client import UnrealExecutor
+        from ue_rest_client import UnrealExecutor, clear_discovery_cache
         HAS_CLIENT = True
     except ImportError:
         HAS_CLIENT = False
 
+from ue_project_utils import is_port_open, load_json, loads_json
+
+# Request bodies for the direct /python/execute POSTs, serialized once
+PAYLOADS: Dict[str, bytes] = {
+    name: json.dumps({"code": code}).encode("utf-8")
+    for name, code in (
+        ("simple", "result = 1 + 1"),
+        ("with_output", "import unreal\nunreal.log('Test output from integration test')"),
+        ("job", "import unreal\nunreal.log('Job management test')"),
+    )
+}
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Upper bound on how much of a response body the tests read (bytes)
+MAX_RESPONSE_BYTES = 1 << 20
+ERROR_SNIPPET_BYTES = 200
+
+
+def read_bounded(response: "requests.Response", limit: int = MAX_RESPONSE_BYTES) -> bytes:
+    """Read at most limit bytes of a response opened with stream=True."""
+    return response.raw.read(limit, decode_content=True)
+
+
+# Bare urllib3 pool for the execute POSTs: requests' per-call cookie, proxy
+# and auth merging buys nothing against a localhost server
+if HAS_REQUESTS:
+    _POOL = urllib3.PoolManager(maxsize=16, retries=False)
+    _POST_TIMEOUT = urllib3.Timeout(connect=REQUEST_TIMEOUT[0], read=REQUEST_TIMEOUT[1])
+
+
+def _post(url: str, payload: bytes) -> Tuple[int, bytes]:
+    """
+    POST a JSON payload over _POOL and return (status_code, body capped at MAX_RESPONSE_BYTES).
+
+    Raises:
+        requests.RequestException: If the request failed (wrapping the urllib3 error)
+    """
+    try:
+        response = _POOL.request(
+            "POST", url,
+            body=payload,
+            headers=JSON_HEADERS,
+            timeout=_POST_TIMEOUT,
+            preload_content=False
+        )
+        try:
+            return response.status, response.read(MAX_RESPONSE_BYTES, decode_content=True)
+        finally:
+            # A body cut off at the cap leaves unread bytes; don't reuse that connection
+            if not response.closed:
+                response.close()
+            response.release_conn()
+    except urllib3.exceptions.HTTPError as e:
+        raise requests.RequestException(e) from e
+
+
+def fetch_bounded(session: "requests.Session", method: str, url: str, **kwargs: Any) -> Tuple[int, bytes]:
+    """
+    Send a request and return (status_code, body capped at MAX_RESPONSE_BYTES).
+
+    Raises:
+        requests.RequestException: If the request failed
+    """
+    with session.request(method, url, stream=True, **kwargs) as response:
+        return response.status_code, read_bounded(response)
+
+
+def error_snippet(body: bytes) -> str:
+    """Decode the start of a response body for an error message."""
+    return body[:ERROR_SNIPPET_BYTES].decode("utf-8", "replace")
+
+
+def _extract_job_id(data: Dict[str, Any]) -> Any:
+    """Return the job id under the first of _JOB_ID_KEYS present, else None."""
+    return next((data[key] for key in _JOB_ID_KEYS if key in data), None)
+
+
+class BufferedPrinter:
+    """Collects output and writes it to stdout in one call per flush."""
+
+    def __init__(self):
+        self.buf: List[str] = []
+
+    def write(self, text: str) -> None:
+        """Queue text for output."""
+        self.buf.append(text)
+
+    def flush(self) -> None:
+        """Write queued text to stdout."""
+        if self.buf:
+            sys.stdout.write("".join(self.buf))
+            sys.stdout.flush()
+            self.buf.clear()
+
 
 class TestResult:
     """Tracks test results with detailed information."""
@@ -64,6 +189,11 @@ class TestResult:
         self.failed: int = 0
         self.skipped: int = 0
         self.results: List[Tuple[str, Optional[bool], str]] = []
+        # (name, message) per outcome, kept as tests are recorded
+        self._failures: List[Tuple[str, str]] = []
+        self._skipped: List[Tuple[str, str]] = []
+        # (category, reason) for categories skipped as a whole
+        self.skipped_categories: List[Tuple[str, str]] = []
 
     def record(self, name: str, passed: bool, message: str = "") -> None:
         """Record a test result (pass or fail)."""
@@ -72,23 +202,42 @@ class TestResult:
             self.passed += 1
         else:
             self.failed += 1
+            self._failures.append((name, message))
 
     def skip(self, name: str, reason: str) -> None:
         """Record a skipped test."""
         self.results.append((name, None, reason))
+        self._skipped.append((name, reason))
         self.skipped += 1
 
+    def skip_category(self, category: str, reason: str) -> None:
+        """Record a whole category as skipped, without per-test entries."""
+        self.skipped_categories.append((category, reason))
+
+    def merge(self, other: "TestResult") -> None:
+        """Append another result set, keeping its order."""
+        self.results.extend(other.results)
+        self._failures.extend(other._failures)
+        self._skipped.extend(other._skipped)
+        self.skipped_categories.extend(other.skipped_categories)
+        self.passed += other.passed
+        self.failed += other.failed
+        self.skipped += other.skipped
+
     def summary(self) -> str:
         """Return summary string."""
-        return f"Passed: {self.passed}, Failed: {self.failed}, Skipped: {self.skipped}"
+        summary = f"Passed: {self.passed}, Failed: {self.failed}, Skipped: {self.skipped}"
+        if self.skipped_categories:
+            summary += f", Skipped categories: {len(self.skipped_categories)}"
+        return summary
 
     def get_failures(self) -> List[Tuple[str, str]]:
         """Return list of (name, message) for failed tests."""
-        return [(name, msg) for name, passed, msg in self.results if passed is False]
+        return self._failures
 
     def get_skipped(self) -> List[Tuple[str, str]]:
         """Return list of (name, reason) for skipped tests."""
-        return [(name, msg) for name, passed, msg in self.results if passed is None]
+        return self._skipped
 
 
 class TestContext:
@@ -99,144 +248,386 @@ class TestContext:
         self.verbose = verbose
         self.config_path = project_dir / "Saved" / "UnrealPythonREST.json"
         self.config: Optional[Dict[str, Any]] = None
+        self.config_error: Optional[str] = None
+        self.port: Optional[int] = None
         self.base_url: Optional[str] = None
         self.executor: Optional[UnrealExecutor] = None
+        self.executor_error: Optional[str] = None
+        self._executor_lock = threading.Lock()
+        self.session: Optional[requests.Session] = _create_session() if HAS_REQUESTS else None
+        # Cached (is_up, skip_reason) from the first /health probe
+        self._server_status: Optional[Tuple[bool, Optional[str]]] = None
+        # Shared /python/execute (status, body) (or its error) for the direct API tests
+        self._execute_probe: Optional[Any] = None
+        self._execute_probe_lock = threading.Lock()
+        # Set by test_execute_get_job_id for the later job tests
+        self.job_id: Optional[Any] = None
+        # Prefetched (status, body) (or error) per job query, see prefetch_job_queries
+        self.job_queries: Dict[str, Any] = {}
 
     def load_config(self) -> bool:
-        """Load config file if it exists."""
-        if not self.config_path.exists():
-            return False
+        """Load config file if it exists, recording why in config_error if not."""
+        self.config_error = None
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
-            port = self.config.get("port", 8080)
-            self.base_url = f"http://localhost:{port}/api/v1"
+            self.config = load_json(self.config_path)
+            self.port = self.config.get("port", 8080)
+            base_url = f"http://localhost:{self.port}/api/v1"
+            if base_url != self.base_url:
+                self.base_url = base_url
+                self._server_status = None
             return True
-        except (json.JSONDecodeError, OSError):
+        except FileNotFoundError:
+            self.config_error = "Config file does not exist"
+            return False
+        except json.JSONDecodeError as e:
+            self.config_error = f"Invalid JSON: {e}"
+            return False
+        except OSError as e:
+            self.config_error = f"Read error: {e}"
             return False
 
+    def probe_execute_once(self) -> Tuple[int, bytes]:
+        """
+        POST a trivial snippet to /python/execute once and share the reply.
+
+        Several direct API tests only inspect different parts of the same
+        response, so they reuse this one request. Safe to call concurrently.
+
+        Returns:
+            (status_code, body) with body capped at MAX_RESPONSE_BYTES
+
+        Raises:
+            requests.RequestException: If the request failed (on every call)
+        """
+        with self._execute_probe_lock:
+            if self._execute_probe is None:
+                try:
+                    self._execute_probe = _post(f"{self.base_url}/python/execute", PAYLOADS["simple"])
+                except requests.RequestException as e:
+                    self._execute_probe = e
+        if isinstance(self._execute_probe, Exception):
+            raise self._execute_probe
+        return self._execute_probe
+
+    def prefetch_job_queries(self) -> None:
+        """
+        GET the job list and the job from test_execute_get_job_id concurrently.
+
+        The job query tests validate these replies instead of each sending
+        its own request. A failed request is stored as its exception.
+        """
+        urls = {"jobs": f"{self.base_url}/python/jobs"}
+        if self.job_id is not None:
+            urls["job"] = f"{self.base_url}/python/job?id={self.job_id}"
+
+        def fetch(url: str) -> Any:
+            try:
+                return fetch_bounded(self.session, "GET", url, timeout=REQUEST_TIMEOUT)
+            except requests.RequestException as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+            self.job_queries = dict(zip(urls, pool.map(fetch, urls.values())))
+
+    def job_query(self, key: str) -> Tuple[int, bytes]:
+        """
+        Return a reply fetched by prefetch_job_queries().
+
+        Raises:
+            requests.RequestException: If that request failed
+        """
+        reply = self.job_queries[key]
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    def server_is_up(self) -> Tuple[bool, Optional[str]]:
+        """
+        Probe the /health endpoint once and cache the outcome.
+
+        Requires requests and a loaded config (base_url).
+
+        Returns:
+            (True, None) if the server answered 200, else (False, skip reason)
+        """
+        if self._server_status is None:
+            try:
+                response = self.session.get(f"{self.base_url}/health", timeout=HEALTH_TIMEOUT)
+                up = response.status_code == 200
+            except requests.RequestException:
+                up = False
+            self._server_status = (True, None) if up else (False, "server not responding")
+        return self._server_status
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        if self.session is not None:
+            self.session.close()
+            _POOL.clear()
+        if self.executor is not None:
+            self.executor.close()
+
     def init_executor(self) -> bool:
-        """Initialize UnrealExecutor if client is available."""
+        """
+        Create the shared UnrealExecutor on first use.
+
+        Later calls reuse it (or the recorded executor_error). Safe to call
+        concurrently.
+        """
         if not HAS_CLIENT:
             return False
-        try:
-            self.executor = UnrealExecutor(str(self.project_dir))
-            return True
-        except Exception:
-            return False
+        with self._executor_lock:
+            if self.executor is None and self.executor_error is None:
+                try:
+                    self.executor = UnrealExecutor(str(self.project_dir))
+                except Exception as e:
+                    self.executor_error = str(e)
+        return self.executor is not None
+
+
+# A test check takes the shared context and returns (passed, message)
+CheckFn = Callable[[TestContext], Tuple[bool, str]]
+
+
+def _run_check(test_fn: CheckFn, ctx: TestContext) -> Tuple[bool, str]:
+    """Call a check, turning an unexpected exception into a failure."""
+    try:
+        return test_fn(ctx)
+    except Exception as e:
+        return False, f"Exception: {e}"
+
+
+def _report(
+    name: str,
+    passed: bool,
+    message: str,
+    results: TestResult,
+    printer: BufferedPrinter,
+    verbose: bool,
+) -> None:
+    """Record a finished test and queue its output on printer."""
+    results.record(name, passed, message)
+    if passed:
+        printer.write(f"  {SYM_PASS} {name}\n")
+        if verbose and message:
+            printer.write(f"      {message}\n")
+    else:
+        printer.write(f"  {SYM_FAIL} {name}\n")
+        if message:
+            printer.write(f"      {message}\n")
 
 
 def run_test(
     name: str,
-    test_fn: Callable[[], Tuple[bool, str]],
+    test_fn: CheckFn,
+    ctx: TestContext,
     results: TestResult,
-    verbose: bool = False,
+    printer: BufferedPrinter,
     skip_reason: Optional[str] = None,
 ) -> None:
-    """Run a single test and record result."""
+    """Run a single test, record result, and queue its output on printer."""
     if skip_reason:
         results.skip(name, skip_reason)
-        if verbose:
-            print(f"  {SYM_SKIP} {name} (skipped: {skip_reason})")
+        if ctx.verbose:
+            printer.write(f"  {SYM_SKIP} {name} (skipped: {skip_reason})\n")
         else:
-            print(f"  {SYM_SKIP} {name}")
+            printer.write(f"  {SYM_SKIP} {name}\n")
         return
 
-    try:
-        passed, message = test_fn()
-        results.record(name, passed, message)
-        if passed:
-            print(f"  {SYM_PASS} {name}")
-            if verbose and message:
-                print(f"      {message}")
-        else:
-            print(f"  {SYM_FAIL} {name}")
-            if message:
-                print(f"      {message}")
-    except Exception as e:
-        results.record(name, False, f"Exception: {e}")
-        print(f"  {SYM_FAIL} {name}")
-        print(f"      Exception: {e}")
+    passed, message = _run_check(test_fn, ctx)
+    _report(name, passed, message, results, printer, ctx.verbose)
+
+
+def skip_category(
+    category: str,
+    reason: str,
+    results: TestResult,
+    printer: BufferedPrinter,
+    verbose: bool,
+) -> None:
+    """Record a whole category as skipped and queue one line for it on printer."""
+    results.skip_category(category, reason)
+    if verbose:
+        printer.write(f"  {SYM_SKIP} all {category} tests (skipped: {reason})\n")
+    else:
+        printer.write(f"  {SYM_SKIP} all {category} tests\n")
+
+
+def run_tests(
+    tests: List[Tuple[str, CheckFn]],
+    ctx: TestContext,
+    results: TestResult,
+    printer: BufferedPrinter,
+    skip_reason: Optional[str] = None,
+    parallel: bool = False,
+) -> None:
+    """
+    Run a table of (name, check) tests with a shared skip reason.
+
+    With parallel=True the checks run concurrently (only for independent,
+    stateless probes); results are still recorded and printed in table order.
+    """
+    if not parallel or skip_reason or len(tests) < 2:
+        for name, test_fn in tests:
+            run_test(name, test_fn, ctx, results, printer, skip_reason)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(TEST_WORKERS, len(tests))) as pool:
+        outcomes = list(pool.map(lambda test: _run_check(test[1], ctx), tests))
+
+    for (name, _), (passed, message) in zip(tests, outcomes):
+        _report(name, passed, message, results, printer, ctx.verbose)
 
 
 # =============================================================================
 # Discovery Tests
 # =============================================================================
 
-def test_discovery(ctx: TestContext, results: TestResult) -> None:
-    """Test server discovery functionality."""
-    print("\n[Discovery Tests]")
+def _check_config_file_exists(ctx: TestContext) -> Tuple[bool, str]:
+    """Config file exists."""
+    exists = ctx.config_path.exists()
+    return exists, f"Path: {ctx.config_path}"
 
-    # Test: Config file exists
-    def test_config_file_exists() -> Tuple[bool, str]:
-        exists = ctx.config_path.exists()
-        return exists, f"Path: {ctx.config_path}"
 
-    run_test("test_config_file_exists", test_config_file_exists, results, ctx.verbose)
+def _check_config_file_valid(ctx: TestContext) -> Tuple[bool, str]:
+    """Config file is valid JSON."""
+    # Also loads the config for the subsequent tests
+    if not ctx.load_config():
+        return False, ctx.config_error or "Config file could not be loaded"
+    return True, f"Keys: {list(ctx.config.keys())[:5]}"
+
+
+def _check_health_endpoint(ctx: TestContext) -> Tuple[bool, str]:
+    """Health endpoint responds."""
+    if not is_port_open(ctx.port):
+        return False, f"Nothing listening on port {ctx.port}"
+    try:
+        response = ctx.session.get(f"{ctx.base_url}/health", timeout=HEALTH_TIMEOUT)
+        if response.status_code == 200:
+            return True, f"Status: {response.status_code}"
+        return False, f"HTTP {response.status_code}"
+    except requests.RequestException as e:
+        return False, f"Connection failed: {e}"
+
+
+def _check_handlers_include_python(ctx: TestContext) -> Tuple[bool, str]:
+    """Handlers include python."""
+    try:
+        response = ctx.session.get(f"{ctx.base_url}/health", timeout=HEALTH_TIMEOUT)
+        if response.status_code != 200:
+            return False, f"HTTP {response.status_code}"
+        data = loads_json(response.content)
+        handlers = data.get("handlers", [])
+        if "python" in handlers:
+            return True, f"Handlers: {handlers}"
+        return False, f"'python' not in handlers: {handlers}"
+    except requests.RequestException as e:
+        return False, f"Connection failed: {e}"
+    except json.JSONDecodeError:
+        return False, "Invalid JSON response"
 
-    # Test: Config file is valid JSON
-    def test_config_file_valid() -> Tuple[bool, str]:
-        if not ctx.config_path.exists():
-            return False, "Config file does not exist"
-        try:
-            with open(ctx.config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            keys = list(data.keys())
-            return True, f"Keys: {keys[:5]}"
-        except json.JSONDecodeError as e:
-            return False, f"Invalid JSON: {e}"
-        except OSError as e:
-            return False, f"Read error: {e}"
 
-    run_test("test_config_file_valid", test_config_file_valid, results, ctx.verbose)
+DISCOVERY_CONFIG_TESTS: List[Tuple[str, CheckFn]] = [
+    ("test_config_file_exists", _check_config_file_exists),
+    ("test_config_file_valid", _check_config_file_valid),
+]
 
-    # Load config for subsequent tests
-    ctx.load_config()
 
-    # Test: Health endpoint responds
+DISCOVERY_SERVER_TESTS: List[Tuple[str, CheckFn]] = [
+    ("test_health_endpoint", _check_health_endpoint),
+    ("test_handlers_include_python", _check_handlers_include_python),
+]
+
+
+def test_discovery(ctx: TestContext, results: TestResult, printer: BufferedPrinter) -> None:
+    """Test server discovery functionality."""
+    printer.write("\n[Discovery Tests]\n")
+
+    # test_config_file_valid loads the config for the tests below
+    run_tests(DISCOVERY_CONFIG_TESTS, ctx, results, printer)
+
+    # Health endpoint tests need requests and a valid config
     skip_health = None
     if not HAS_REQUESTS:
         skip_health = "requires requests library"
     elif not ctx.base_url:
         skip_health = "no valid config file"
 
-    def test_health_endpoint() -> Tuple[bool, str]:
-        try:
-            response = requests.get(f"{ctx.base_url}/health", timeout=5)
-            if response.status_code == 200:
-                return True, f"Status: {response.status_code}"
-            return False, f"HTTP {response.status_code}"
-        except requests.RequestException as e:
-            return False, f"Connection failed: {e}"
-
-    run_test("test_health_endpoint", test_health_endpoint, results, ctx.verbose, skip_health)
-
-    # Test: Handlers include python
-    def test_handlers_include_python() -> Tuple[bool, str]:
-        try:
-            response = requests.get(f"{ctx.base_url}/health", timeout=5)
-            if response.status_code != 200:
-                return False, f"HTTP {response.status_code}"
-            data = response.json()
-            handlers = data.get("handlers", [])
-            if "python" in handlers:
-                return True, f"Handlers: {handlers}"
-            return False, f"'python' not in handlers: {handlers}"
-        except requests.RequestException as e:
-            return False, f"Connection failed: {e}"
-        except json.JSONDecodeError:
-            return False, "Invalid JSON response"
-
-    run_test("test_handlers_include_python", test_handlers_include_python, results, ctx.verbose, skip_health)
+    run_tests(DISCOVERY_SERVER_TESTS, ctx, results, printer, skip_health, parallel=True)
 
 
 # =============================================================================
 # Direct API Tests
 # =============================================================================
 
-def test_direct_api(ctx: TestContext, results: TestResult) -> None:
+def _check_execute_endpoint_exists(ctx: TestContext) -> Tuple[bool, str]:
+    """Execute endpoint exists."""
+    try:
+        # Any HTTP response, even an error, means the endpoint exists
+        status_code, _ = ctx.probe_execute_once()
+        return True, f"Status: {status_code}"
+    except requests.RequestException as e:
+        return False, f"Connection failed: {e}"
+
+
+def _check_execute_simple(ctx: TestContext) -> Tuple[bool, str]:
+    """Execute simple code."""
+    try:
+        status_code, body = ctx.probe_execute_once()
+        if status_code == 200:
+            data = loads_json(body)
+            return data.get("success", False), f"Response: {data}"
+        return False, f"HTTP {status_code}: {error_snippet(body)}"
+    except requests.RequestException as e:
+        return False, f"Request failed: {e}"
+    except json.JSONDecodeError:
+        return False, "Invalid JSON response"
+
+
+def _check_execute_with_output(ctx: TestContext) -> Tuple[bool, str]:
+    """Execute with output."""
+    try:
+        status_code, body = _post(f"{ctx.base_url}/python/execute", PAYLOADS["with_output"])
+        if status_code == 200:
+            data = loads_json(body)
+            success = data.get("success", False)
+            logs = data.get("logs", [])
+            return success, f"Logs: {logs[:3]}"
+        return False, f"HTTP {status_code}"
+    except requests.RequestException as e:
+        return False, f"Request failed: {e}"
+    except json.JSONDecodeError:
+        return False, "Invalid JSON response"
+
+
+def _check_execute_returns_job_id(ctx: TestContext) -> Tuple[bool, str]:
+    """Execute returns job_id."""
+    try:
+        status_code, body = ctx.probe_execute_once()
+        if status_code == 200:
+            data = loads_json(body)
+            job_id = _extract_job_id(data)
+            if job_id is not None:
+                return True, f"job_id: {job_id}"
+            return False, f"No job_id in response: {list(data.keys())}"
+        return False, f"HTTP {status_code}"
+    except requests.RequestException as e:
+        return False, f"Request failed: {e}"
+    except json.JSONDecodeError:
+        return False, "Invalid JSON response"
+
+
+DIRECT_API_TESTS: List[Tuple[str, CheckFn]] = [
+    ("test_execute_endpoint_exists", _check_execute_endpoint_exists),
+    ("test_execute_simple", _check_execute_simple),
+    ("test_execute_with_output", _check_execute_with_output),
+    ("test_execute_returns_job_id", _check_execute_returns_job_id),
+]
+
+
+def test_direct_api(ctx: TestContext, results: TestResult, printer: BufferedPrinter) -> None:
     """Test REST API directly with requests library."""
-    print("\n[Direct API Tests]")
+    printer.write("\n[Direct API Tests]\n")
 
     skip_reason = None
     if not HAS_REQUESTS:
@@ -246,188 +637,224 @@ def test_direct_api(ctx: TestContext, results: TestResult) -> None:
 
     # Check if server is actually running
     if not skip_reason:
-        try:
-            response = requests.get(f"{ctx.base_url}/health", timeout=2)
-            if response.status_code != 200:
-                skip_reason = "server not responding"
-        except requests.RequestException:
-            skip_reason = "server not responding"
-
-    # Test: Execute endpoint exists
-    def test_execute_endpoint_exists() -> Tuple[bool, str]:
-        try:
-            # OPTIONS request to check endpoint exists
-            response = requests.options(f"{ctx.base_url}/python/execute", timeout=5)
-            # Some servers return 200, some 204, some 405 (method not allowed but endpoint exists)
-            if response.status_code in (200, 204, 405):
-                return True, f"Status: {response.status_code}"
-            # Try POST with empty body to verify endpoint
-            response = requests.post(
-                f"{ctx.base_url}/python/execute",
-                json={},
-                timeout=5
-            )
-            # Even an error response means endpoint exists
-            return True, f"Status: {response.status_code}"
-        except requests.RequestException as e:
-            return False, f"Connection failed: {e}"
-
-    run_test("test_execute_endpoint_exists", test_execute_endpoint_exists, results, ctx.verbose, skip_reason)
-
-    # Test: Execute simple code
-    def test_execute_simple() -> Tuple[bool, str]:
-        try:
-            response = requests.post(
-                f"{ctx.base_url}/python/execute",
-                json={"code": "result = 1 + 1"},
-                timeout=10
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("success", False), f"Response: {data}"
-            return False, f"HTTP {response.status_code}: {response.text[:100]}"
-        except requests.RequestException as e:
-            return False, f"Request failed: {e}"
-
-    run_test("test_execute_simple", test_execute_simple, results, ctx.verbose, skip_reason)
-
-    # Test: Execute with output
-    def test_execute_with_output() -> Tuple[bool, str]:
-        try:
-            response = requests.post(
-                f"{ctx.base_url}/python/execute",
-                json={"code": "import unreal\nunreal.log('Test output from integration test')"},
-                timeout=10
-            )
-            if response.status_code == 200:
-                data = response.json()
-                success = data.get("success", False)
-                logs = data.get("logs", [])
-                return success, f"Logs: {logs[:3]}"
-            return False, f"HTTP {response.status_code}"
-        except requests.RequestException as e:
-            return False, f"Request failed: {e}"
-
-    run_test("test_execute_with_output", test_execute_with_output, results, ctx.verbose, skip_reason)
+        up, reason = ctx.server_is_up()
+        skip_reason = None if up else reason
 
-    # Test: Execute returns job_id
-    def test_execute_returns_job_id() -> Tuple[bool, str]:
-        try:
-            response = requests.post(
-                f"{ctx.base_url}/python/execute",
-                json={"code": "pass"},
-                timeout=10
-            )
-            if response.status_code == 200:
-                data = response.json()
-                job_id = data.get("job_id") or data.get("jobId") or data.get("id")
-                if job_id:
-                    return True, f"job_id: {job_id}"
-                return False, f"No job_id in response: {list(data.keys())}"
-            return False, f"HTTP {response.status_code}"
-        except requests.RequestException as e:
-            return False, f"Request failed: {e}"
+    if skip_reason:
+        skip_category("api", skip_reason, results, printer, ctx.verbose)
+        return
 
-    run_test("test_execute_returns_job_id", test_execute_returns_job_id, results, ctx.verbose, skip_reason)
+    run_tests(DIRECT_API_TESTS, ctx, results, printer, parallel=True)
 
 
 # =============================================================================
 # Python Execution Tests
 # =============================================================================
 
-def test_python_execution(ctx: TestContext, results: TestResult) -> None:
-    """Test Python code execution via client or REST."""
-    print("\n[Python Execution Tests]")
+def _check_simple_print(ctx: TestContext) -> Tuple[bool, str]:
+    """Simple print statement."""
+    result = ctx.executor.execute("import unreal\nunreal.log('Hello from test')")
+    return result["success"], f"Mode: {result.get('mode')}, Duration: {result.get('duration_ms')}ms"
 
-    skip_reason = None
-    if not HAS_CLIENT:
-        skip_reason = "ue_rest_client not available"
-    elif not ctx.init_executor():
-        skip_reason = "failed to create executor"
-    elif ctx.executor and ctx.executor.mode != "rest":
-        # Check if server is running
-        try:
-            if HAS_REQUESTS and ctx.base_url:
-                response = requests.get(f"{ctx.base_url}/health", timeout=2)
-                if response.status_code != 200:
-                    skip_reason = "REST server not running"
-            else:
-                skip_reason = "REST server not available"
-        except Exception:
-            skip_reason = "REST server not responding"
-
-    # Test: Simple print statement
-    def test_simple_print() -> Tuple[bool, str]:
-        result = ctx.executor.execute("import unreal\nunreal.log('Hello from test')")
-        return result["success"], f"Mode: {result.get('mode')}, Duration: {result.get('duration_ms')}ms"
-
-    run_test("test_simple_print", test_simple_print, results, ctx.verbose, skip_reason)
-
-    # Test: Import unreal module
-    def test_import_unreal() -> Tuple[bool, str]:
-        result = ctx.executor.execute("import unreal\nunreal.log('unreal module imported')")
-        return result["success"], f"Logs: {result.get('logs', [])[:2]}"
-
-    run_test("test_import_unreal", test_import_unreal, results, ctx.verbose, skip_reason)
-
-    # Test: Get engine version
-    def test_get_engine_version() -> Tuple[bool, str]:
-        code = """
+
+def _check_import_unreal(ctx: TestContext) -> Tuple[bool, str]:
+    """Import unreal module."""
+    result = ctx.executor.execute("import unreal\nunreal.log('unreal module imported')")
+    return result["success"], f"Logs: {result.get('logs', [])[:2]}"
+
+
+def _check_get_engine_version(ctx: TestContext) -> Tuple[bool, str]:
+    """Get engine version."""
+    code = """
 import unreal
 version = unreal.SystemLibrary.get_engine_version()
 unreal.log(f'Engine version: {version}')
 """
-        result = ctx.executor.execute(code)
-        logs = result.get("logs", [])
-        version_log = [l for l in logs if "Engine version" in l]
-        if result["success"] and version_log:
-            return True, version_log[0]
-        return result["success"], f"Logs: {logs[:2]}"
-
-    run_test("test_get_engine_version", test_get_engine_version, results, ctx.verbose, skip_reason)
-
-    # Test: Syntax error handling
-    def test_syntax_error() -> Tuple[bool, str]:
-        result = ctx.executor.execute("def broken(")
-        # This should fail (success=False) because of syntax error
-        if not result["success"]:
-            return True, "Correctly detected syntax error"
-        return False, "Syntax error was not detected"
-
-    run_test("test_syntax_error", test_syntax_error, results, ctx.verbose, skip_reason)
-
-    # Test: Runtime error handling
-    def test_runtime_error() -> Tuple[bool, str]:
-        result = ctx.executor.execute("raise ValueError('Test error from integration test')")
-        # This should fail (success=False) because of runtime error
-        if not result["success"]:
-            return True, "Correctly detected runtime error"
-        return False, "Runtime error was not detected"
-
-    run_test("test_runtime_error", test_runtime_error, results, ctx.verbose, skip_reason)
-
-    # Test: Multiple statements
-    def test_multiple_statements() -> Tuple[bool, str]:
-        code = """
+    result = ctx.executor.execute(code)
+    logs = result.get("logs", [])
+    version_log = [l for l in logs if "Engine version" in l]
+    if result["success"] and version_log:
+        return True, version_log[0]
+    return result["success"], f"Logs: {logs[:2]}"
+
+
+def _check_syntax_error(ctx: TestContext) -> Tuple[bool, str]:
+    """Syntax error handling."""
+    result = ctx.executor.execute("def broken(")
+    # This should fail (success=False) because of syntax error
+    if not result["success"]:
+        return True, "Correctly detected syntax error"
+    return False, "Syntax error was not detected"
+
+
+def _check_runtime_error(ctx: TestContext) -> Tuple[bool, str]:
+    """Runtime error handling."""
+    result = ctx.executor.execute("raise ValueError('Test error from integration test')")
+    # This should fail (success=False) because of runtime error
+    if not result["success"]:
+        return True, "Correctly detected runtime error"
+    return False, "Runtime error was not detected"
+
+
+def _check_multiple_statements(ctx: TestContext) -> Tuple[bool, str]:
+    """Multiple statements."""
+    code = """
 import unreal
 x = 10
 y = 20
 z = x + y
 unreal.log(f'Sum: {z}')
 """
-        result = ctx.executor.execute(code)
-        return result["success"], f"Duration: {result.get('duration_ms')}ms"
+    result = ctx.executor.execute(code)
+    return result["success"], f"Duration: {result.get('duration_ms')}ms"
+
+
+PYTHON_EXECUTION_TESTS: List[Tuple[str, CheckFn]] = [
+    ("test_simple_print", _check_simple_print),
+    ("test_import_unreal", _check_import_unreal),
+    ("test_get_engine_version", _check_get_engine_version),
+    ("test_syntax_error", _check_syntax_error),
+    ("test_runtime_error", _check_runtime_error),
+    ("test_multiple_statements", _check_multiple_statements),
+]
 
-    run_test("test_multiple_statements", test_multiple_statements, results, ctx.verbose, skip_reason)
+
+def test_python_execution(ctx: TestContext, results: TestResult, printer: BufferedPrinter) -> None:
+    """Test Python code execution via client or REST."""
+    printer.write("\n[Python Execution Tests]\n")
+
+    skip_reason = None
+    if not HAS_CLIENT:
+        skip_reason = "ue_rest_client not available"
+    elif not ctx.init_executor():
+        skip_reason = "failed to create executor"
+    elif ctx.executor and ctx.executor.mode != "rest":
+        # Check if server is running
+        if HAS_REQUESTS and ctx.base_url:
+            up, reason = ctx.server_is_up()
+            skip_reason = None if up else reason
+        else:
+            skip_reason = "REST server not available"
+
+    if skip_reason:
+        skip_category("execution", skip_reason, results, printer, ctx.verbose)
+        return
+
+    # Serial: the checks share one UnrealExecutor, whose breaker state and
+    # dispatch are not thread-safe (and commandlets would each launch an editor)
+    run_tests(PYTHON_EXECUTION_TESTS, ctx, results, printer)
 
 
 # =============================================================================
 # Job Management Tests
 # =============================================================================
 
-def test_job_management(ctx: TestContext, results: TestResult) -> None:
+def _check_execute_get_job_id(ctx: TestContext) -> Tuple[bool, str]:
+    """Execute and get job_id."""
+    try:
+        status_code, body = _post(f"{ctx.base_url}/python/execute", PAYLOADS["job"])
+        if status_code == 200:
+            data = loads_json(body)
+            job_id = _extract_job_id(data)
+            if job_id is not None:
+                ctx.job_id = job_id
+                return True, f"job_id: {job_id}"
+            return False, f"No job_id: {list(data.keys())}"
+        return False, f"HTTP {status_code}"
+    except requests.RequestException as e:
+        return False, f"Request failed: {e}"
+    except json.JSONDecodeError:
+        return False, "Invalid JSON response"
+
+
+def _check_list_jobs(ctx: TestContext) -> Tuple[bool, str]:
+    """List jobs endpoint."""
+    try:
+        status_code, body = ctx.job_query("jobs")
+        if status_code == 200:
+            data = loads_json(body)
+            jobs = data.get("jobs", data) if isinstance(data, dict) else data
+            if isinstance(jobs, list):
+                return True, f"Found {len(jobs)} jobs"
+            return True, f"Response: {type(data)}"
+        elif status_code == 404:
+            return False, "Jobs endpoint not implemented"
+        return False, f"HTTP {status_code}"
+    except requests.RequestException as e:
+        return False, f"Request failed: {e}"
+    except json.JSONDecodeError:
+        return False, "Invalid JSON response"
+
+
+def _check_get_job_by_id(ctx: TestContext) -> Tuple[bool, str]:
+    """Get job by ID."""
+    if ctx.job_id is None:
+        return False, "No job_id from previous test"
+    try:
+        status_code, body = ctx.job_query("job")
+        if status_code == 200:
+            data = loads_json(body)
+            return True, f"Job data: {list(data.keys())[:5]}"
+        elif status_code == 404:
+            return False, "Job endpoint not implemented or job not found"
+        return False, f"HTTP {status_code}"
+    except requests.RequestException as e:
+        return False, f"Request failed: {e}"
+    except json.JSONDecodeError:
+        return False, "Invalid JSON response"
+
+
+def _check_job_status_completed(ctx: TestContext) -> Tuple[bool, str]:
+    """Job status is completed."""
+    if ctx.job_id is None:
+        return False, "No job_id from previous test"
+    try:
+        job_id = ctx.job_id
+        # Poll with backoff until the job leaves pending/running or the deadline passes,
+        # starting from the prefetched reply
+        deadline = time.monotonic() + JOB_POLL_DEADLINE
+        delay = JOB_POLL_INITIAL_DELAY
+        url = f"{ctx.base_url}/python/job?id={job_id}"
+        status_code, body = ctx.job_query("job")
+        while True:
+            if status_code == 404:
+                return False, "Job endpoint not implemented"
+            if status_code != 200:
+                return False, f"HTTP {status_code}"
+            data = loads_json(body)
+            # Status is nested inside job object
+            job_data = data.get("job", data)
+            status = job_data.get("status", "unknown")
+            if status in ("completed", "success", "done"):
+                return True, f"Status: {status}"
+            if status not in JOB_ACTIVE_STATUSES or time.monotonic() + delay >= deadline:
+                return False, f"Status: {status}"
+            time.sleep(delay)
+            delay = min(delay * 2, JOB_POLL_MAX_DELAY)
+            status_code, body = fetch_bounded(ctx.session, "GET", url, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        return False, f"Request failed: {e}"
+    except json.JSONDecodeError:
+        return False, "Invalid JSON response"
+
+
+# Creates the job the query tests inspect, so it runs first on its own
+JOB_SETUP_TESTS: List[Tuple[str, CheckFn]] = [
+    ("test_execute_get_job_id", _check_execute_get_job_id),
+]
+
+
+# Validate the replies fetched by TestContext.prefetch_job_queries
+JOB_QUERY_TESTS: List[Tuple[str, CheckFn]] = [
+    ("test_list_jobs", _check_list_jobs),
+    ("test_get_job_by_id", _check_get_job_by_id),
+    ("test_job_status_completed", _check_job_status_completed),
+]
+
+
+def test_job_management(ctx: TestContext, results: TestResult, printer: BufferedPrinter) -> None:
     """Test job listing and management endpoints."""
-    print("\n[Job Management Tests]")
+    printer.write("\n[Job Management Tests]\n")
 
     skip_reason = None
     if not HAS_REQUESTS:
@@ -437,203 +864,204 @@ def test_job_management(ctx: TestContext, results: TestResult) -> None:
 
     # Check if server is running
     if not skip_reason:
-        try:
-            response = requests.get(f"{ctx.base_url}/health", timeout=2)
-            if response.status_code != 200:
-                skip_reason = "server not responding"
-        except requests.RequestException:
-            skip_reason = "server not responding"
+        up, reason = ctx.server_is_up()
+        skip_reason = None if up else reason
 
-    # Store job_id for subsequent tests
-    job_id_holder = {"id": None}
+    if skip_reason:
+        skip_category("jobs", skip_reason, results, printer, ctx.verbose)
+        return
 
-    # Test: Execute and get job_id
-    def test_execute_get_job_id() -> Tuple[bool, str]:
-        try:
-            response = requests.post(
-                f"{ctx.base_url}/python/execute",
-                json={"code": "import unreal\nunreal.log('Job management test')"},
-                timeout=10
-            )
-            if response.status_code == 200:
-                data = response.json()
-                job_id = data.get("job_id") or data.get("jobId") or data.get("id")
-                if job_id:
-                    job_id_holder["id"] = job_id
-                    return True, f"job_id: {job_id}"
-                return False, f"No job_id: {list(data.keys())}"
-            return False, f"HTTP {response.status_code}"
-        except requests.RequestException as e:
-            return False, f"Request failed: {e}"
+    # test_execute_get_job_id stores the job_id for subsequent tests
+    ctx.job_id = None
 
-    run_test("test_execute_get_job_id", test_execute_get_job_id, results, ctx.verbose, skip_reason)
+    run_tests(JOB_SETUP_TESTS, ctx, results, printer)
+    ctx.prefetch_job_queries()
+    run_tests(JOB_QUERY_TESTS, ctx, results, printer)
 
-    # Test: List jobs endpoint
-    def test_list_jobs() -> Tuple[bool, str]:
-        try:
-            response = requests.get(f"{ctx.base_url}/python/jobs", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                jobs = data.get("jobs", data) if isinstance(data, dict) else data
-                if isinstance(jobs, list):
-                    return True, f"Found {len(jobs)} jobs"
-                return True, f"Response: {type(data)}"
-            elif response.status_code == 404:
-                return False, "Jobs endpoint not implemented"
-            return False, f"HTTP {response.status_code}"
-        except requests.RequestException as e:
-            return False, f"Request failed: {e}"
 
-    run_test("test_list_jobs", test_list_jobs, results, ctx.verbose, skip_reason)
+# =============================================================================
+# Client Tests
+# =============================================================================
 
-    # Test: Get job by ID
-    def test_get_job_by_id() -> Tuple[bool, str]:
-        if not job_id_holder["id"]:
-            return False, "No job_id from previous test"
-        try:
-            job_id = job_id_holder["id"]
-            response = requests.get(f"{ctx.base_url}/python/job?id={job_id}", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                return True, f"Job data: {list(data.keys())[:5]}"
-            elif response.status_code == 404:
-                return False, "Job endpoint not implemented or job not found"
-            return False, f"HTTP {response.status_code}"
-        except requests.RequestException as e:
-            return False, f"Request failed: {e}"
+def _check_executor_creation(ctx: TestContext) -> Tuple[bool, str]:
+    """Executor creation."""
+    try:
+        # Build a fresh one to exercise the constructor; other tests reuse
+        # ctx.executor. Clear the shared discovery cache so it really probes
+        clear_discovery_cache()
+        executor = UnrealExecutor(str(ctx.project_dir))
+        mode = executor.mode
+        executor.close()
+        return True, f"Mode: {mode}"
+    except Exception as e:
+        return False, f"Creation failed: {e}"
 
-    run_test("test_get_job_by_id", test_get_job_by_id, results, ctx.verbose, skip_reason)
 
-    # Test: Job status is completed
-    def test_job_status_completed() -> Tuple[bool, str]:
-        if not job_id_holder["id"]:
-            return False, "No job_id from previous test"
-        try:
-            job_id = job_id_holder["id"]
-            # Wait a bit for job to complete
-            time.sleep(0.5)
-            response = requests.get(f"{ctx.base_url}/python/job?id={job_id}", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                # Status is nested inside job object
-                job_data = data.get("job", data)
-                status = job_data.get("status", "unknown")
-                if status in ("completed", "success", "done"):
-                    return True, f"Status: {status}"
-                return False, f"Status: {status}"
-            elif response.status_code == 404:
-                return False, "Job endpoint not implemented"
-            return False, f"HTTP {response.status_code}"
-        except requests.RequestException as e:
-            return False, f"Request failed: {e}"
+def _check_executor_mode(ctx: TestContext) -> Tuple[bool, str]:
+    """Executor mode property."""
+    try:
+        if not ctx.init_executor():
+            return False, f"Error: {ctx.executor_error}"
+        executor = ctx.executor
+        mode = executor.mode
+        if mode in ("rest", "commandlet"):
+            return True, f"Mode: {mode}"
+        return False, f"Invalid mode: {mode}"
+    except Exception as e:
+        return False, f"Error: {e}"
 
-    run_test("test_job_status_completed", test_job_status_completed, results, ctx.verbose, skip_reason)
 
+def _check_executor_server_info(ctx: TestContext) -> Tuple[bool, str]:
+    """Server info property."""
+    try:
+        if not ctx.init_executor():
+            return False, f"Error: {ctx.executor_error}"
+        executor = ctx.executor
+        info = executor.server_info
+        if executor.mode == "rest":
+            if info:
+                return True, f"Info keys: {list(info.keys())[:5]}"
+            return False, "REST mode but no server_info"
+        else:
+            if info is None:
+                return True, "Correctly None for commandlet mode"
+            return False, f"Expected None, got: {info}"
+    except Exception as e:
+        return False, f"Error: {e}"
+
+
+def _check_is_rest_available(ctx: TestContext) -> Tuple[bool, str]:
+    """is_rest_available method."""
+    try:
+        if not ctx.init_executor():
+            return False, f"Error: {ctx.executor_error}"
+        executor = ctx.executor
+        available = executor.is_rest_available()
+        expected = (executor.mode == "rest")
+        if available == expected:
+            return True, f"Available: {available}"
+        return False, f"Mismatch: available={available}, mode={executor.mode}"
+    except Exception as e:
+        return False, f"Error: {e}"
 
-# =============================================================================
-# Client Tests
-# =============================================================================
 
-def test_client(ctx: TestContext, results: TestResult) -> None:
+def _check_refresh_connection(ctx: TestContext) -> Tuple[bool, str]:
+    """refresh_connection method."""
+    try:
+        if not ctx.init_executor():
+            return False, f"Error: {ctx.executor_error}"
+        executor = ctx.executor
+        initial_mode = executor.mode
+        result = executor.refresh_connection()
+        final_mode = executor.mode
+        return True, f"Refresh returned {result}, mode: {initial_mode} -> {final_mode}"
+    except Exception as e:
+        return False, f"Error: {e}"
+
+
+def _check_execute_result_structure(ctx: TestContext) -> Tuple[bool, str]:
+    """Execute method returns correct structure."""
+    try:
+        if not ctx.init_executor():
+            return False, f"Error: {ctx.executor_error}"
+        executor = ctx.executor
+        # This will work in either mode
+        result = executor.execute("pass", timeout=5)
+        required_keys = {"success", "output", "logs", "duration_ms", "mode"}
+        actual_keys = set(result.keys())
+        missing = required_keys - actual_keys
+        if missing:
+            return False, f"Missing keys: {missing}"
+        return True, f"Keys: {list(result.keys())}"
+    except Exception as e:
+        return False, f"Error: {e}"
+
+
+CLIENT_TESTS: List[Tuple[str, CheckFn]] = [
+    ("test_executor_creation", _check_executor_creation),
+    ("test_executor_mode", _check_executor_mode),
+    ("test_executor_server_info", _check_executor_server_info),
+    ("test_is_rest_available", _check_is_rest_available),
+    ("test_refresh_connection", _check_refresh_connection),
+    ("test_execute_result_structure", _check_execute_result_structure),
+]
+
+
+def test_client(ctx: TestContext, results: TestResult, printer: BufferedPrinter) -> None:
     """Test UnrealExecutor client functionality."""
-    print("\n[Client Tests]")
+    printer.write("\n[Client Tests]\n")
 
     skip_reason = None
     if not HAS_CLIENT:
         skip_reason = "ue_rest_client not available"
 
-    # Test: Executor creation
-    def test_executor_creation() -> Tuple[bool, str]:
-        try:
-            executor = UnrealExecutor(str(ctx.project_dir))
-            return True, f"Mode: {executor.mode}"
-        except Exception as e:
-            return False, f"Creation failed: {e}"
-
-    run_test("test_executor_creation", test_executor_creation, results, ctx.verbose, skip_reason)
-
-    # Test: Executor mode property
-    def test_executor_mode() -> Tuple[bool, str]:
-        try:
-            executor = UnrealExecutor(str(ctx.project_dir))
-            mode = executor.mode
-            if mode in ("rest", "commandlet"):
-                return True, f"Mode: {mode}"
-            return False, f"Invalid mode: {mode}"
-        except Exception as e:
-            return False, f"Error: {e}"
-
-    run_test("test_executor_mode", test_executor_mode, results, ctx.verbose, skip_reason)
-
-    # Test: Server info property
-    def test_executor_server_info() -> Tuple[bool, str]:
-        try:
-            executor = UnrealExecutor(str(ctx.project_dir))
-            info = executor.server_info
-            if executor.mode == "rest":
-                if info:
-                    return True, f"Info keys: {list(info.keys())[:5]}"
-                return False, "REST mode but no server_info"
-            else:
-                if info is None:
-                    return True, "Correctly None for commandlet mode"
-                return False, f"Expected None, got: {info}"
-        except Exception as e:
-            return False, f"Error: {e}"
-
-    run_test("test_executor_server_info", test_executor_server_info, results, ctx.verbose, skip_reason)
-
-    # Test: is_rest_available method
-    def test_is_rest_available() -> Tuple[bool, str]:
-        try:
-            executor = UnrealExecutor(str(ctx.project_dir))
-            available = executor.is_rest_available()
-            expected = (executor.mode == "rest")
-            if available == expected:
-                return True, f"Available: {available}"
-            return False, f"Mismatch: available={available}, mode={executor.mode}"
-        except Exception as e:
-            return False, f"Error: {e}"
-
-    run_test("test_is_rest_available", test_is_rest_available, results, ctx.verbose, skip_reason)
-
-    # Test: refresh_connection method
-    def test_refresh_connection() -> Tuple[bool, str]:
-        try:
-            executor = UnrealExecutor(str(ctx.project_dir))
-            initial_mode = executor.mode
-            result = executor.refresh_connection()
-            final_mode = executor.mode
-            return True, f"Refresh returned {result}, mode: {initial_mode} -> {final_mode}"
-        except Exception as e:
-            return False, f"Error: {e}"
-
-    run_test("test_refresh_connection", test_refresh_connection, results, ctx.verbose, skip_reason)
-
-    # Test: Execute method returns correct structure
-    def test_execute_result_structure() -> Tuple[bool, str]:
-        try:
-            executor = UnrealExecutor(str(ctx.project_dir))
-            # This will work in either mode
-            result = executor.execute("pass", timeout=5)
-            required_keys = {"success", "output", "logs", "duration_ms", "mode"}
-            actual_keys = set(result.keys())
-            missing = required_keys - actual_keys
-            if missing:
-                return False, f"Missing keys: {missing}"
-            return True, f"Keys: {list(result.keys())}"
-        except Exception as e:
-            return False, f"Error: {e}"
+    if skip_reason:
+        skip_category("client", skip_reason, results, printer, ctx.verbose)
+        return
 
-    run_test("test_execute_result_structure", test_execute_result_structure, results, ctx.verbose, skip_reason)
+    run_tests(CLIENT_TESTS, ctx, results, printer)
 
 
 # =============================================================================
 # Main Entry Point
 # =============================================================================
 
-def main() -> int:
-    """Main entry point."""
+# Test categories in report order
+CategoryFn = Callable[[TestContext, TestResult, BufferedPrinter], None]
+CATEGORIES: List[Tuple[str, CategoryFn]] = [
+    ("discovery", test_discovery),
+    ("api", test_direct_api),
+    ("execution", test_python_execution),
+    ("jobs", test_job_management),
+    ("client", test_client),
+]
+
+
+def run_categories(
+    categories: List[Tuple[str, CategoryFn]],
+    ctx: TestContext,
+    results: TestResult,
+) -> None:
+    """
+    Run test categories, overlapping their request latency.
+
+    Discovery runs first on its own since it validates the config the other
+    categories depend on. Client runs last on its own since its checks
+    re-discover the server on the shared executor, which execution uses. The
+    rest run concurrently, each into its own result set and output buffer,
+    which are merged and printed in order.
+    """
+    first = [c for c in categories if c[0] == "discovery"]
+    last = [c for c in categories if c[0] == "client"]
+    concurrent = [c for c in categories if c[0] not in ("discovery", "client")]
+
+    def run_serial(group: List[Tuple[str, CategoryFn]]) -> None:
+        for _, category_fn in group:
+            printer = BufferedPrinter()
+            category_fn(ctx, results, printer)
+            printer.flush()
+
+    run_serial(first)
+
+    if concurrent:
+        outputs = [(TestResult(), BufferedPrinter()) for _ in concurrent]
+        with ThreadPoolExecutor(max_workers=len(concurrent)) as pool:
+            futures = [
+                pool.submit(category_fn, ctx, category_results, printer)
+                for (_, category_fn), (category_results, printer) in zip(concurrent, outputs)
+            ]
+            for future in futures:
+                future.result()
+
+        for category_results, printer in outputs:
+            results.merge(category_results)
+            printer.flush()
+
+    run_serial(last)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
     parser = argparse.ArgumentParser(
         description="Integration tests for UnrealPythonREST plugin",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -661,73 +1089,86 @@ Categories:
         default="all",
         help="Test category to run (default: all)"
     )
-    args = parser.parse_args()
+    return parser
 
-    project_dir = Path(args.project_dir).resolve()
-    if not project_dir.exists():
-        print(f"Error: Project directory does not exist: {project_dir}")
-        return 1
 
-    results = TestResult()
-    ctx = TestContext(project_dir, args.verbose)
+_ARG_PARSER = _build_parser()
 
-    print(f"Testing UnrealPythonREST for project: {project_dir}")
-    print("=" * 60)
 
-    # Show environment info
-    print(f"  requests library: {'available' if HAS_REQUESTS else 'NOT AVAILABLE'}")
-    print(f"  ue_rest_client:   {'available' if HAS_CLIENT else 'NOT AVAILABLE'}")
-    print(f"  config file:      {'exists' if ctx.config_path.exists() else 'not found'}")
-
-    if ctx.load_config() and ctx.base_url:
-        print(f"  server URL:       {ctx.base_url}")
-        # Try to check if server is running
-        if HAS_REQUESTS:
-            try:
-                response = requests.get(f"{ctx.base_url}/health", timeout=2)
-                print(f"  server status:    {'running' if response.status_code == 200 else 'not responding'}")
-            except requests.RequestException:
-                print("  server status:    not responding")
+def main() -> int:
+    """Main entry point."""
+    args = _ARG_PARSER.parse_args()
 
-    # Run selected test categories
-    category = args.category
+    try:
+        st = os.stat(args.project_dir)
+    except OSError:
+        print(f"Error: Project directory does not exist: {os.path.abspath(args.project_dir)}")
+        return 1
+    if not stat.S_ISDIR(st.st_mode):
+        print(f"Error: Not a directory: {os.path.abspath(args.project_dir)}")
+        return 1
+    project_dir = Path(os.path.realpath(args.project_dir))
 
-    if category in ("discovery", "all"):
-        test_discovery(ctx, results)
+    results = TestResult()
+    ctx = TestContext(project_dir, args.verbose)
+    printer = BufferedPrinter()
+    selected = [(name, fn) for name, fn in CATEGORIES if args.category in (name, "all")]
+
+    # Preflight: the /health probe needs base_url from the (local) config, then
+    # runs alongside executor construction, which does its own server discovery
+    config_loaded = ctx.load_config()
+    server_up: Optional[bool] = None
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        if HAS_CLIENT and any(name in ("execution", "client") for name, _ in selected):
+            pool.submit(ctx.init_executor)
+        if config_loaded and HAS_REQUESTS:
+            health = pool.submit(ctx.server_is_up)
+            server_up = health.result()[0]
+
+    printer.write(f"Testing UnrealPythonREST for project: {project_dir}\n")
+    printer.write("=" * 60 + "\n")
 
-    if category in ("api", "all"):
-        test_direct_api(ctx, results)
+    # Show environment info
+    printer.write(f"  requests library: {'available' if HAS_REQUESTS else 'NOT AVAILABLE'}\n")
+    printer.write(f"  ue_rest_client:   {'available' if HAS_CLIENT else 'NOT AVAILABLE'}\n")
+    printer.write(f"  config file:      {'exists' if ctx.config_path.exists() else 'not found'}\n")
 
-    if category in ("execution", "all"):
-        test_python_execution(ctx, results)
+    if config_loaded:
+        printer.write(f"  server URL:       {ctx.base_url}\n")
+        if server_up is not None:
+            printer.write(f"  server status:    {'running' if server_up else 'not responding'}\n")
+    printer.flush()
 
-    if category in ("jobs", "all"):
-        test_job_management(ctx, results)
+    # Run selected test categories
+    run_categories(selected, ctx, results)
 
-    if category in ("client", "all"):
-        test_client(ctx, results)
+    ctx.close()
 
     # Print summary
-    print()
-    print("=" * 60)
-    print(f"Results: {results.summary()}")
+    printer.write("\n" + "=" * 60 + "\n")
+    printer.write(f"Results: {results.summary()}\n")
 
     # Print failures
     failures = results.get_failures()
     if failures:
-        print(f"\nFailed tests ({len(failures)}):")
+        printer.write(f"\nFailed tests ({len(failures)}):\n")
         for name, msg in failures:
-            print(f"  {SYM_FAIL} {name}")
+            printer.write(f"  {SYM_FAIL} {name}\n")
             if msg:
-                print(f"      {msg}")
+                printer.write(f"      {msg}\n")
 
     # Print skipped (only in verbose mode)
     if args.verbose:
         skipped = results.get_skipped()
         if skipped:
-            print(f"\nSkipped tests ({len(skipped)}):")
+            printer.write(f"\nSkipped tests ({len(skipped)}):\n")
             for name, reason in skipped:
-                print(f"  {SYM_SKIP} {name}: {reason}")
+                printer.write(f"  {SYM_SKIP} {name}: {reason}\n")
+        if results.skipped_categories:
+            printer.write(f"\nSkipped categories ({len(results.skipped_categories)}):\n")
+            for category, reason in results.skipped_categories:
+                printer.write(f"  {SYM_SKIP} {category}: {reason}\n")
+    printer.flush()
 
     return 0 if results.failed == 0 else 1
 
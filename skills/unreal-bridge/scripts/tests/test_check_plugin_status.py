@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Tests for check_plugin_status.py"""
+
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import check_plugin_status
+from check_plugin_status import check_status
+
+
+class TestCheckStatusVersions:
+    """Tests for version reporting in check_status()"""
+
+    def test_reports_installed_version_and_update(self, tmp_path, monkeypatch):
+        """Should read the version from the installer's plugin directory"""
+        plugin_dir = tmp_path / "Plugins" / "UnrealBridgeREST"
+        plugin_dir.mkdir(parents=True)
+        (plugin_dir / "VERSION.json").write_text('{"version": "0.0.1"}')
+        monkeypatch.setattr(check_plugin_status, "get_source_version", lambda: "0.0.2")
+
+        status = check_status(str(tmp_path))
+
+        assert status["installed_version"] == "0.0.1"
+        assert status["update_available"] is True
+
+    def test_no_installed_version_without_plugin(self, tmp_path, monkeypatch):
+        """Should leave installed_version unset when the plugin is absent"""
+        monkeypatch.setattr(check_plugin_status, "get_source_version", lambda: "0.0.2")
+
+        status = check_status(str(tmp_path))
+
+        assert status["installed_version"] is None
+        assert status["update_available"] is False
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Tests for install_plugin.py"""
 
+import errno
 import json
+import os
 import tempfile
 from pathlib import Path
 import sys
@@ -11,12 +13,13 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from install_plugin import (
+    copy_plugin,
     ensure_plugin_enabled,
     InstallResult,
     read_plugin_version,
     compare_versions,
 )
-from ue_project_utils import find_uproject_file
+from ue_project_utils import find_uproject_file, index_plugins, load_json
 
 
 class TestFindUprojectFile:
@@ -55,6 +58,47 @@ class TestFindUprojectFile:
         result = find_uproject_file(tmp_path)
         assert result is None
 
+    def test_ignores_directories_named_like_uproject(self, tmp_path):
+        """Should only consider regular files"""
+        (tmp_path / "Backup.uproject").mkdir()
+        uproject = tmp_path / "MyGame.uproject"
+        uproject.write_text('{}')
+
+        result = find_uproject_file(tmp_path)
+        assert result == uproject
+
+    def test_sees_files_added_after_previous_lookup(self, tmp_path):
+        """Should rescan when the directory contents change"""
+        assert find_uproject_file(tmp_path) is None
+
+        uproject = tmp_path / "MyGame.uproject"
+        uproject.write_text('{}')
+
+        result = find_uproject_file(tmp_path)
+        assert result == uproject
+
+
+class TestLoadJson:
+    """Tests for load_json()"""
+
+    def test_returns_cached_result_when_unchanged(self, tmp_path):
+        """Should reuse the parsed object while the file is unchanged"""
+        path = tmp_path / "config.json"
+        path.write_text('{"port": 8080}')
+
+        first = load_json(path)
+        assert first == {"port": 8080}
+        assert load_json(path) is first
+
+    def test_reloads_after_file_changes(self, tmp_path):
+        """Should reparse when the file content changes"""
+        path = tmp_path / "config.json"
+        path.write_text('{"port": 8080}')
+        load_json(path)
+
+        path.write_text('{"port": 18080}')
+        assert load_json(path) == {"port": 18080}
+
 
 class TestEnsurePluginEnabled:
     """Tests for ensure_plugin_enabled()"""
@@ -105,6 +149,30 @@ class TestEnsurePluginEnabled:
         assert data["Plugins"][0] == {"Name": "OtherPlugin", "Enabled": True}
         assert data["Plugins"][1] == {"Name": "AnotherPlugin", "Enabled": False}
 
+    def test_enables_first_duplicate_and_skips_malformed_entries(self):
+        """Should enable the first matching entry and ignore non-dict entries"""
+        data = {"Plugins": [
+            "NotAnEntry",
+            {"Name": "TestPlugin", "Enabled": False},
+            {"Name": "TestPlugin", "Enabled": False}
+        ]}
+        modified = ensure_plugin_enabled(data, "TestPlugin")
+
+        assert modified is True
+        assert len(data["Plugins"]) == 3
+        assert data["Plugins"][1]["Enabled"] is True
+        assert data["Plugins"][2]["Enabled"] is False
+
+    def test_shared_index_tracks_added_plugins(self):
+        """Should update a passed-in index so later calls see added entries"""
+        data = {"Plugins": [{"Name": "OtherPlugin", "Enabled": True}]}
+        index = index_plugins(data["Plugins"])
+
+        assert ensure_plugin_enabled(data, "TestPlugin", index) is True
+        assert ensure_plugin_enabled(data, "TestPlugin", index) is False
+        assert index["TestPlugin"] is data["Plugins"][1]
+        assert len(data["Plugins"]) == 2
+
 
 class TestInstallResult:
     """Tests for InstallResult class"""
@@ -180,6 +248,126 @@ class TestInstallResult:
         assert "This is a warning" in result.warnings
 
 
+class TestCopyPlugin:
+    """Tests for copy_plugin()"""
+
+    def test_copies_nested_tree(self, tmp_path):
+        """Should copy files in nested directories with their content"""
+        source = tmp_path / "src"
+        (source / "Source" / "Module").mkdir(parents=True)
+        (source / "Plugin.uplugin").write_text('{"Version": 1}')
+        (source / "Source" / "Module" / "Module.Build.cs").write_text("// build")
+        dest = tmp_path / "Project" / "Plugins" / "Plugin"
+        dest.parent.mkdir(parents=True)
+
+        result = InstallResult()
+        success, backup_path = copy_plugin(source, dest, result)
+
+        assert success is True
+        assert backup_path is None
+        assert (dest / "Plugin.uplugin").read_text() == '{"Version": 1}'
+        assert (dest / "Source" / "Module" / "Module.Build.cs").read_text() == "// build"
+
+    def test_preserves_file_and_directory_times(self, tmp_path):
+        """Should copy modification times like shutil.copytree"""
+        source = tmp_path / "src"
+        (source / "Source").mkdir(parents=True)
+        (source / "Source" / "a.txt").write_text("a")
+        os.utime(source / "Source" / "a.txt", (1_000_000, 1_000_000))
+        os.utime(source / "Source", (2_000_000, 2_000_000))
+        dest = tmp_path / "dest"
+
+        success, _ = copy_plugin(source, dest, InstallResult())
+
+        assert success is True
+        assert (dest / "Source" / "a.txt").stat().st_mtime == 1_000_000
+        assert (dest / "Source").stat().st_mtime == 2_000_000
+
+    def test_skips_ignored_entries(self, tmp_path):
+        """Should not copy git metadata or Python bytecode"""
+        source = tmp_path / "src"
+        (source / ".git").mkdir(parents=True)
+        (source / ".git" / "HEAD").write_text("ref")
+        (source / "__pycache__").mkdir()
+        (source / "__pycache__" / "mod.cpython-311.pyc").write_bytes(b"\0")
+        (source / ".gitignore").write_text("*.pyc")
+        (source / "script.pyc").write_bytes(b"\0")
+        (source / "script.py").write_text("pass")
+        dest = tmp_path / "dest"
+
+        success, _ = copy_plugin(source, dest, InstallResult())
+
+        assert success is True
+        assert sorted(p.name for p in dest.iterdir()) == ["script.py"]
+
+    def test_backs_up_existing_plugin_and_rolls_back(self, tmp_path):
+        """Should move an existing plugin to Saved and restore it on rollback"""
+        source = tmp_path / "src"
+        source.mkdir()
+        (source / "new.txt").write_text("new")
+        dest = tmp_path / "Project" / "Plugins" / "Plugin"
+        dest.mkdir(parents=True)
+        (dest / "old.txt").write_text("old")
+
+        result = InstallResult()
+        success, backup_path = copy_plugin(source, dest, result)
+
+        assert success is True
+        assert backup_path == tmp_path / "Project" / "Saved" / "PluginBackups" / "Plugin.backup"
+        assert (backup_path / "old.txt").read_text() == "old"
+        assert [p.name for p in dest.iterdir()] == ["new.txt"]
+
+        result.rollback()
+
+        assert [p.name for p in dest.iterdir()] == ["old.txt"]
+        assert not backup_path.exists()
+
+    def test_replaces_stale_backup(self, tmp_path):
+        """Should discard a leftover backup from an earlier install"""
+        source = tmp_path / "src"
+        source.mkdir()
+        (source / "new.txt").write_text("new")
+        dest = tmp_path / "Project" / "Plugins" / "Plugin"
+        dest.mkdir(parents=True)
+        (dest / "old.txt").write_text("old")
+        stale = tmp_path / "Project" / "Saved" / "PluginBackups" / "Plugin.backup"
+        stale.mkdir(parents=True)
+        (stale / "stale.txt").write_text("stale")
+
+        success, backup_path = copy_plugin(source, dest, InstallResult())
+
+        assert success is True
+        assert backup_path == stale
+        assert [p.name for p in backup_path.iterdir()] == ["old.txt"]
+        assert [p.name for p in dest.iterdir()] == ["new.txt"]
+
+    def test_backs_up_across_devices(self, tmp_path, monkeypatch):
+        """Should fall back to copying when renames fail with EXDEV"""
+        def cross_device(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "replace", cross_device)
+        monkeypatch.setattr(os, "rename", cross_device)
+        source = tmp_path / "src"
+        source.mkdir()
+        (source / "new.txt").write_text("new")
+        dest = tmp_path / "Project" / "Plugins" / "Plugin"
+        dest.mkdir(parents=True)
+        (dest / "old.txt").write_text("old")
+
+        result = InstallResult()
+        success, backup_path = copy_plugin(source, dest, result)
+
+        assert success is True
+        assert [p.name for p in backup_path.iterdir()] == ["old.txt"]
+        assert [p.name for p in dest.iterdir()] == ["new.txt"]
+
+        result.rollback()
+
+        assert [p.name for p in dest.iterdir()] == ["old.txt"]
+        assert not backup_path.exists()
+
+
 class TestVersionFunctions:
     """Tests for version comparison functions"""
 
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""Tests for ue_rest_client.py log parsing"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ue_rest_client import (
+    UnrealExecutor,
+    _indent_code,
+    _parse_commandlet_lines,
+    _python_log_lines,
+    clear_discovery_cache,
+    parse_log_output_from_text,
+)
+
+START = "<<<UNREAL_PYTHON_OUTPUT_START>>>"
+END = "<<<UNREAL_PYTHON_OUTPUT_END>>>"
+
+
+class TestParseLogOutputFromText:
+    """Tests for parse_log_output_from_text()"""
+
+    def test_extracts_messages_and_strips_level_prefix(self):
+        """Should keep only LogPython lines, without Display/Warning/Error prefixes"""
+        text = (
+            "LogInit: Display: Engine started\n"
+            "LogPython: Display: first\n"
+            "LogPython: Warning: second\n"
+            "LogPython: third\n"
+        )
+        assert parse_log_output_from_text(text) == ["first", "second", "third"]
+
+    def test_returns_empty_without_marker(self):
+        """Should return an empty list when no line matches"""
+        assert parse_log_output_from_text("LogInit: nothing here\n") == []
+
+
+class TestParseCommandletLines:
+    """Tests for _parse_commandlet_lines()"""
+
+    def test_returns_logs_and_marked_output(self):
+        """Should return all Python logs and only the messages between markers"""
+        text = (
+            "LogPython: before\n"
+            f"LogPython: {START}\n"
+            "LogPython: Display: hello\n"
+            "LogPython: Error: oops\n"
+            f"LogPython: {END}\n"
+            "LogPython: after\n"
+        )
+        logs, output = _parse_commandlet_lines(text.splitlines())
+
+        assert logs == ["before", START, "hello", "oops", END, "after"]
+        assert output == "hello\noops\n"
+
+    def test_matches_separate_parsers_on_crlf_output(self):
+        """Should agree with parse_log_output_from_text on Windows line endings"""
+        text = f"LogPython: {START}\r\nLogPython: hi\r\nLogPython: {END}\r\n"
+        logs, output = _parse_commandlet_lines(text.splitlines())
+
+        assert logs == parse_log_output_from_text(text)
+        assert output == "hi\n"
+
+    def test_empty_output_when_end_marker_missing(self):
+        """Should return no output when the run never logged the end marker"""
+        text = f"LogPython: {START}\nLogPython: partial\n"
+        logs, output = _parse_commandlet_lines(text.splitlines())
+
+        assert logs == [START, "partial"]
+        assert output == ""
+
+    def test_empty_output_when_end_precedes_start(self):
+        """Should return no output when the markers are out of order"""
+        text = f"LogPython: {END}\nLogPython: x\nLogPython: {START}\n"
+        _, output = _parse_commandlet_lines(text.splitlines())
+
+        assert output == ""
+
+
+class TestIndentCode:
+    """Tests for _indent_code()"""
+
+    def test_normalizes_crlf_and_trailing_newline(self):
+        """Should emit LF-only lines so text-mode writes don't produce \\r\\r\\n"""
+        code = 'x = """a\r\nb"""\r\n\r\ny = 1 + \\\r\n    2\r\n'
+
+        assert _indent_code(code, 4) == '    x = """a\n    b"""\n\n    y = 1 + \\\n        2'
+
+
+class TestPythonLogLines:
+    """Tests for _python_log_lines()"""
+
+    def test_decodes_only_python_and_marker_lines(self):
+        """Should drop unrelated engine lines and decode the rest as UTF-8"""
+        raw = [
+            b"LogInit: Display: Engine started\r\n",
+            "LogPython: caf\u00e9\r\n".encode("utf-8"),
+            f"LogTemp: {END}\n".encode(),
+            b"LogTemp: \xff\n",
+        ]
+
+        assert list(_python_log_lines(raw)) == [
+            "LogPython: caf\u00e9\r\n",
+            f"LogTemp: {END}\n",
+        ]
+
+
+class _FakeServerHandler(BaseHTTPRequestHandler):
+    """Minimal REST plugin stand-in driven by attributes on its server."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.server.health_checks += 1
+        self._send(200, {"status": "ok"})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.posts += 1
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self._send(status, {"success": status == 200, "output": "ok", "logs": []})
+
+
+class _FakeServer(ThreadingHTTPServer):
+    """Threaded server that stays quiet when a client gives up on a reply."""
+
+    def handle_error(self, request, client_address):
+        pass
+
+
+@pytest.fixture
+def rest_server(tmp_path):
+    """Serve a fake REST plugin and point tmp_path's config at it."""
+    server = _FakeServer(("127.0.0.1", 0), _FakeServerHandler)
+    server.health_checks = 0
+    server.posts = 0
+    server.statuses = []
+    server.delay = 0.0
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+
+    (tmp_path / "Saved").mkdir()
+    (tmp_path / "Saved" / UnrealExecutor.CONFIG_FILENAME).write_text(
+        json.dumps({"port": server.server_address[1]})
+    )
+    clear_discovery_cache()
+    yield server
+    clear_discovery_cache()
+    server.shutdown()
+    server.server_close()
+
+
+def _make_executor(project_dir):
+    """Create an executor whose commandlet fallback never launches an editor."""
+    executor = UnrealExecutor(str(project_dir))
+    executor._execute_commandlet = lambda code, timeout: {"success": False}
+    # Re-pick dispatch so it binds the stub rather than the real method
+    executor._set_dispatch(executor.rest_url is not None)
+    executor.REST_BACKOFF = 0
+    return executor
+
+
+class TestCircuitBreaker:
+    """Tests for the REST circuit breaker in UnrealExecutor"""
+
+    def test_opens_after_threshold_and_recovers_after_cooldown(self, tmp_path, rest_server):
+        """Should switch to the commandlet after CB_THRESHOLD failures, then retry REST"""
+        executor = _make_executor(tmp_path)
+        executor.CB_COOLDOWN = 0.2
+        rest_server.statuses = [500] * executor.CB_THRESHOLD
+
+        modes = [executor.execute("pass")["mode"] for _ in range(executor.CB_THRESHOLD)]
+        assert modes == ["rest"] * executor.CB_THRESHOLD
+        assert executor.mode == "commandlet"
+        assert executor.is_rest_available() is False
+
+        assert executor.execute("pass")["mode"] == "commandlet"
+        assert rest_server.posts == executor.CB_THRESHOLD
+
+        time.sleep(0.25)
+        assert executor.mode == "rest"
+        result = executor.execute("pass")
+
+        assert result["mode"] == "rest"
+        assert result["success"] is True
+        assert executor._cb_failures == 0
+        executor.close()
+
+
+class TestDiscoveryCache:
+    """Tests for the shared discovery cache"""
+
+    def test_reuses_result_until_config_changes(self, tmp_path, rest_server):
+        """Should skip the health check for an unchanged config and redo it after an edit"""
+        _make_executor(tmp_path).close()
+        _make_executor(tmp_path).close()
+        assert rest_server.health_checks == 1
+
+        config = tmp_path / "Saved" / UnrealExecutor.CONFIG_FILENAME
+        mtime_ns = config.stat().st_mtime_ns + 1_000_000_000
+        os.utime(config, ns=(mtime_ns, mtime_ns))
+        executor = _make_executor(tmp_path)
+
+        assert rest_server.health_checks == 2
+        assert executor.mode == "rest"
+        executor.close()
+
+
+class TestServerInfo:
+    """Tests for the server_info property"""
+
+    def test_returns_serializable_copy(self, tmp_path, rest_server):
+        """Should return a plain dict that callers can dump and modify safely"""
+        executor = _make_executor(tmp_path)
+        info = executor.server_info
+
+        assert json.loads(json.dumps(info)) == {"port": rest_server.server_address[1]}
+        info["port"] = 0
+        assert executor.server_info["port"] == rest_server.server_address[1]
+        executor.close()
+
+
+class TestExecuteRetries:
+    """Tests for retrying transient REST errors"""
+
+    def test_retries_post_on_503(self, tmp_path, rest_server):
+        """Should resend the request while the server reports 503"""
+        executor = _make_executor(tmp_path)
+        rest_server.statuses = [503, 503]
+
+        result = executor.execute("pass")
+
+        assert result["mode"] == "rest"
+        assert result["success"] is True
+        assert rest_server.posts == 3
+        executor.close()
+
+    def test_does_not_retry_post_after_read_timeout(self, tmp_path, rest_server):
+        """Should not resend code the server may already be running"""
+        executor = _make_executor(tmp_path)
+        rest_server.delay = 0.5
+
+        result = executor.execute("pass", timeout=0.1)
+
+        assert result["success"] is False
+        assert rest_server.posts == 1
+        executor.close()
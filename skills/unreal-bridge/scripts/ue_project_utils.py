@@ -4,8 +4,145 @@
 from __future__ import annotations
 
 import json
+import os
+import socket
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+# orjson is optional - faster JSON parsing/serialization if available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str, using orjson when available.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if not HAS_ORJSON:
+        return json.loads(data)
+    if isinstance(data, bytes) and data.startswith(_UTF8_BOM):
+        data = data[len(_UTF8_BOM):]
+    return orjson.loads(data)
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize obj as 2-space indented JSON, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
+def scan_dir(path: Path) -> Optional[Dict[str, os.DirEntry]]:
+    """List a directory with a single scandir call.
+
+    Args:
+        path: Directory to list
+
+    Returns:
+        Mapping of entry name to DirEntry, or None if path is not a readable
+        directory
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return None
+
+
+def is_file(path: Path) -> bool:
+    """Check that path is a regular file using a single stat call."""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def is_port_open(port: int, host: str = "localhost", timeout: float = 0.2) -> bool:
+    """Check whether anything accepts TCP connections on a port.
+
+    A refused connection returns immediately, so this is much cheaper than an
+    HTTP request that has to wait out its timeout when the editor is closed.
+
+    Args:
+        port: Port to probe
+        host: Host to connect to
+        timeout: Connect timeout in seconds
+
+    Returns:
+        True if the connection succeeded, False otherwise
+    """
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+@lru_cache(maxsize=64)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file; cached on path plus file state so edits invalidate."""
+    return loads_json(Path(path_str).read_bytes())
+
+
+def load_json(path: Path) -> Any:
+    """Load a small JSON file, reusing the parsed result while it is unchanged.
+
+    The returned object is shared between callers and must not be mutated.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    st = os.stat(path)
+    return _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=64)
+def _cached_uproject_scan(dir_str: str, mtime_ns: int) -> Tuple[str, ...]:
+    """List .uproject file names in a directory.
+
+    Cached per directory mtime, which changes whenever an entry is added,
+    removed or renamed, so a stale listing is never returned.
+    """
+    with os.scandir(dir_str) as it:
+        return tuple(
+            entry.name for entry in it
+            if os.path.normcase(entry.name).endswith(".uproject") and entry.is_file()
+        )
+
+
+def list_uproject_files(project_dir: Path) -> List[Path]:
+    """List .uproject files directly inside project_dir.
+
+    Repeated calls reuse the previous scan until the directory changes.
+
+    Args:
+        project_dir: Path to the project directory
+
+    Returns:
+        Paths of the .uproject files, empty if none or the directory is unreadable
+    """
+    try:
+        dir_str = os.path.abspath(project_dir)
+        names = _cached_uproject_scan(dir_str, os.stat(dir_str).st_mtime_ns)
+    except OSError:
+        names = ()
+    return [project_dir / name for name in names]
 
 
 def find_uproject_file_with_reason(project_dir: Path) -> Tuple[Optional[Path], str]:
@@ -19,7 +156,7 @@ def find_uproject_file_with_reason(project_dir: Path) -> Tuple[Optional[Path], s
         - If found: (path, "Found") or (path, "Found (matched directory name)")
         - If not found: (None, "reason why not found")
     """
-    uproject_files = list(project_dir.glob("*.uproject"))
+    uproject_files = list_uproject_files(project_dir)
 
     if len(uproject_files) == 0:
         return None, "No .uproject file found in directory"
@@ -51,6 +188,26 @@ def find_uproject_file(project_dir: Path) -> Optional[Path]:
     return path
 
 
+def index_plugins(plugins: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index .uproject plugin entries by name.
+
+    The first entry wins when a name is listed more than once, matching a
+    front-to-back scan. Entries are the same dict objects as in the list, so
+    mutating them updates the .uproject data in place.
+
+    Args:
+        plugins: The .uproject "Plugins" list
+
+    Returns:
+        Mapping of plugin name to its entry
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    for plugin in plugins:
+        if isinstance(plugin, dict):
+            index.setdefault(plugin.get("Name"), plugin)
+    return index
+
+
 def read_uproject(path: Path) -> Dict[str, Any]:
     """Read and parse .uproject JSON file.
 
@@ -60,8 +217,7 @@ def read_uproject(path: Path) -> Dict[str, Any]:
     Returns:
         Parsed JSON data as dict
     """
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return loads_json(Path(path).read_bytes())
 
 
 def write_uproject(path: Path, data: Dict[str, Any]) -> None:
@@ -16,16 +16,59 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import subprocess
 import tempfile
+import textwrap
+import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ue_project_utils import is_file, list_uproject_files, load_json
+
+# Logged by the commandlet wrapper around the user code's output
+_MARKER_START = "<<<UNREAL_PYTHON_OUTPUT_START>>>"
+_MARKER_END = "<<<UNREAL_PYTHON_OUTPUT_END>>>"
+# Finds whichever marker comes first in a line
+_MARKER_RE = re.compile(f"{re.escape(_MARKER_START)}|{re.escape(_MARKER_END)}")
+# Commandlet script template; the user code goes between these, indented
+_WRAPPER_PREFIX = f'''
+# Auto-generated wrapper for commandlet execution
+import unreal
+
+_MARKER_START = "{_MARKER_START}"
+_MARKER_END = "{_MARKER_END}"
+
+unreal.log(_MARKER_START)
+try:
+'''
+_WRAPPER_SUFFIX = '''
+except Exception as _e:
+    unreal.log_error(f"Execution error: {_e}")
+unreal.log(_MARKER_END)
+'''
+# Byte forms for filtering the raw commandlet pipe before decoding
+_LOG_TAG_B = b"LogPython:"
+_MARKER_START_B = _MARKER_START.encode()
+_MARKER_END_B = _MARKER_END.encode()
+
+# Platform-specific editor executable, relative to an engine root
+_IS_WIN = os.name == 'nt'
+_EXE_NAME = "UnrealEditor-Cmd.exe" if _IS_WIN else "UnrealEditor-Cmd"
+_REL_PATH = Path("Engine/Binaries/Win64" if _IS_WIN else "Engine/Binaries/Linux") / _EXE_NAME
+
+# Discovery results shared by every UnrealExecutor in the process:
+# project_dir -> (monotonic timestamp, config st_mtime_ns, rest_url, server_info)
+_discovery_cache: Dict[Path, Tuple[float, int, Optional[str], Optional[Dict[str, Any]]]] = {}
 
 # requests is optional - graceful fallback if not available
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
@@ -37,6 +80,22 @@ class UnrealExecutor:
     CONFIG_FILENAME = "UnrealPythonREST.json"
     DEFAULT_TIMEOUT = 30
     HEALTH_CHECK_TIMEOUT = 2
+    # Connect timeout for every REST call; the read timeout is the per-call
+    # budget, so a dead server fails fast without cutting long scripts short
+    CONNECT_TIMEOUT = 1.0
+    # Circuit breaker: after CB_THRESHOLD consecutive REST failures, route
+    # execute() to the commandlet for CB_COOLDOWN seconds, then let one
+    # trial request through (a failure reopens it, a success closes it)
+    CB_THRESHOLD = 5
+    CB_COOLDOWN = 10.0
+    # refresh_connection() reuses a discovery result younger than this (seconds)
+    DISCOVER_TTL = 5.0
+    # Transient execute errors (refused connections, 502/503/504) are retried
+    # this many times with exponential backoff before execute() gives up; the
+    # breaker only sees the final outcome of each call. Health checks are
+    # never retried, so discovering a closed editor stays fast
+    REST_RETRIES = 2
+    REST_BACKOFF = 0.2
 
     def __init__(self, project_dir: str, engine_dir: Optional[str] = None):
         """
@@ -50,15 +109,88 @@ class UnrealExecutor:
         self.engine_dir = Path(engine_dir) if engine_dir else None
         self.rest_url: Optional[str] = None
         self._server_info: Optional[Dict[str, Any]] = None
+        # Keep-alive session, created on first HTTP request
+        self._session: Optional[requests.Session] = None
+        self._cb_failures = 0
+        self._cb_opened_at = 0.0
+        self._last_discover_ts = 0.0
 
         # Auto-discover server on init
         self._discover_server()
 
+    def _get_session(self) -> requests.Session:
+        """Return the keep-alive session, creating it on first use."""
+        if self._session is None:
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            self._session = session
+        return self._session
+
+    def _get_execute_session(self, url: str) -> requests.Session:
+        """Return the session with a retrying adapter mounted for url."""
+        session = self._get_session()
+        if url not in session.adapters:
+            session.mount(url, HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=4,
+                max_retries=_retry_policy(self.REST_RETRIES, self.REST_BACKOFF),
+            ))
+        return session
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __del__(self):
+        # __init__ may not have completed
+        if getattr(self, "_session", None) is not None:
+            self.close()
+
+    def _circuit_open(self) -> bool:
+        """Return True while REST calls should be skipped."""
+        return bool(self._cb_opened_at) and time.monotonic() - self._cb_opened_at < self.CB_COOLDOWN
+
+    def _record_rest_failure(self) -> None:
+        """Count a failed REST call, opening the breaker at the threshold."""
+        self._cb_failures += 1
+        # Don't trust the cached discovery result after a failure
+        self._last_discover_ts = 0.0
+        _discovery_cache.pop(self.project_dir, None)
+        # A failed trial request after the cooldown reopens immediately
+        if self._cb_opened_at or self._cb_failures >= self.CB_THRESHOLD:
+            self._cb_opened_at = time.monotonic()
+            self._set_dispatch(False)
+
+    def _record_rest_success(self) -> None:
+        """Close the breaker."""
+        self._cb_failures = 0
+        self._cb_opened_at = 0.0
+
     def _get_config_path(self) -> Path:
         """Get path to REST server config file."""
         return self.project_dir / "Saved" / self.CONFIG_FILENAME
 
+    def _set_dispatch(self, rest: bool) -> None:
+        """Route execute() to the REST server or to the commandlet."""
+        if rest:
+            self._dispatch, self._dispatch_mode = self._execute_rest, "rest"
+        else:
+            self._dispatch, self._dispatch_mode = self._execute_commandlet, "commandlet"
+
     def _discover_server(self) -> Optional[str]:
+        """
+        Look for the REST server and pick how execute() dispatches.
+
+        Returns:
+            Base URL if server is alive, None otherwise
+        """
+        url = self._find_server()
+        self._set_dispatch(url is not None and not self._circuit_open())
+        return url
+
+    def _find_server(self) -> Optional[str]:
         """
         Check for running REST server via config file.
 
@@ -68,37 +200,47 @@ class UnrealExecutor:
         if not HAS_REQUESTS:
             return None
 
+        now = time.monotonic()
+        self._last_discover_ts = now
         config_path = self._get_config_path()
 
-        if not config_path.exists():
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
             self.rest_url = None
             self._server_info = None
             return None
 
+        # Reuse another instance's recent result for an unchanged config
+        cached = _discovery_cache.get(self.project_dir)
+        if cached is not None and cached[1] == mtime_ns and now - cached[0] < self.DISCOVER_TTL:
+            _, _, self.rest_url, self._server_info = cached
+            return self.rest_url
+
+        self.rest_url = None
+        self._server_info = None
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = load_json(config_path)
 
             port = config.get("port", 8080)
             base_url = f"http://localhost:{port}/api/v1"
 
             # Verify server is actually running with health check
-            response = requests.get(
+            response = self._get_session().get(
                 f"{base_url}/health",
-                timeout=self.HEALTH_CHECK_TIMEOUT
+                timeout=(self.CONNECT_TIMEOUT, self.HEALTH_CHECK_TIMEOUT)
             )
 
             if response.status_code == 200:
                 self.rest_url = base_url
                 self._server_info = config
-                return base_url
+                self._record_rest_success()
 
         except (json.JSONDecodeError, requests.RequestException, OSError):
             pass
 
-        self.rest_url = None
-        self._server_info = None
-        return None
+        _discovery_cache[self.project_dir] = (now, mtime_ns, self.rest_url, self._server_info)
+        return self.rest_url
 
     def execute(self, code: str, timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Any]:
         """
@@ -113,11 +255,14 @@ class UnrealExecutor:
         """
         start_time = time.time()
 
+        # The breaker routes to the commandlet while open; once the cooldown
+        # is over, let a trial request through to the server
+        if self._cb_opened_at and self.rest_url and not self._circuit_open():
+            self._set_dispatch(True)
+
+        mode = self._dispatch_mode
         try:
-            if self.rest_url and HAS_REQUESTS:
-                result = self._execute_rest(code, timeout)
-            else:
-                result = self._execute_commandlet(code, timeout)
+            result = self._dispatch(code, timeout)
         except Exception as e:
             result = {
                 "success": False,
@@ -128,7 +273,7 @@ class UnrealExecutor:
 
         # Ensure consistent response format
         result["duration_ms"] = int((time.time() - start_time) * 1000)
-        result["mode"] = self.mode
+        result["mode"] = mode
         result.setdefault("success", False)
         result.setdefault("output", "")
         result.setdefault("logs", [])
@@ -141,7 +286,7 @@ class UnrealExecutor:
 
         Args:
             code: Python code to execute
-            timeout: Request timeout in seconds
+            timeout: Read timeout in seconds (connecting is capped at CONNECT_TIMEOUT)
 
         Returns:
             Response from REST API
@@ -149,12 +294,23 @@ class UnrealExecutor:
         if not self.rest_url:
             raise RuntimeError("REST server not available")
 
-        response = requests.post(
-            f"{self.rest_url}/python/execute",
-            json={"code": code},
-            timeout=timeout,
-            headers={"Content-Type": "application/json"}
-        )
+        url = f"{self.rest_url}/python/execute"
+        try:
+            response = self._get_execute_session(url).post(
+                url,
+                json={"code": code},
+                timeout=(self.CONNECT_TIMEOUT, timeout),
+                headers={"Content-Type": "application/json"}
+            )
+        except requests.RequestException:
+            self._record_rest_failure()
+            raise
+
+        # Only server-side errors count against the breaker; 4xx means it is up
+        if response.status_code >= 500:
+            self._record_rest_failure()
+        else:
+            self._record_rest_success()
 
         if response.status_code == 200:
             data = response.json()
@@ -193,7 +349,7 @@ class UnrealExecutor:
             }
 
         # Find .uproject file
-        uproject_files = list(self.project_dir.glob("*.uproject"))
+        uproject_files = list_uproject_files(self.project_dir)
         if not uproject_files:
             return {
                 "success": False,
@@ -203,30 +359,13 @@ class UnrealExecutor:
             }
         uproject = uproject_files[0]
 
-        # Create temp script file
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.py',
-            delete=False,
-            encoding='utf-8'
-        ) as f:
-            # Add output marker for parsing
-            wrapper_code = f'''
-# Auto-generated wrapper for commandlet execution
-import unreal
-
-_MARKER_START = "<<<UNREAL_PYTHON_OUTPUT_START>>>"
-_MARKER_END = "<<<UNREAL_PYTHON_OUTPUT_END>>>"
+        # Add output marker for parsing
+        wrapper_code = _WRAPPER_PREFIX + _indent_code(code, 4) + _WRAPPER_SUFFIX
 
-unreal.log(_MARKER_START)
-try:
-{_indent_code(code, 4)}
-except Exception as _e:
-    unreal.log_error(f"Execution error: {{_e}}")
-unreal.log(_MARKER_END)
-'''
+        # Create temp script file
+        fd, script_path = tempfile.mkstemp(suffix='.py')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
             f.write(wrapper_code)
-            script_path = f.name
 
         try:
             # Build command
@@ -241,33 +380,42 @@ unreal.log(_MARKER_END)
                 "-nullrhi",
             ]
 
-            # Execute commandlet
-            result = subprocess.run(
+            # Execute commandlet, parsing its log as it streams in
+            with subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 cwd=str(self.project_dir),
-            )
-
-            # Parse output
-            logs = parse_log_output_from_text(result.stdout + result.stderr)
-            output = _extract_marked_output(result.stdout + result.stderr)
+            ) as proc:
+                timed_out = threading.Event()
+
+                def _kill() -> None:
+                    timed_out.set()
+                    proc.kill()
+
+                watchdog = threading.Timer(timeout, _kill)
+                watchdog.start()
+                try:
+                    logs, output = _parse_commandlet_lines(_python_log_lines(proc.stdout))
+                    returncode = proc.wait()
+                finally:
+                    watchdog.cancel()
+
+            if timed_out.is_set():
+                return {
+                    "success": False,
+                    "output": "",
+                    "logs": [f"Commandlet timed out after {timeout}s"],
+                    "error": "Timeout",
+                }
 
             return {
-                "success": result.returncode == 0,
+                "success": returncode == 0,
                 "output": output,
                 "logs": logs,
-                "returncode": result.returncode,
+                "returncode": returncode,
             }
 
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "output": "",
-                "logs": [f"Commandlet timed out after {timeout}s"],
-                "error": "Timeout",
-            }
         finally:
             # Cleanup temp file
             try:
@@ -277,82 +425,125 @@ unreal.log(_MARKER_END)
 
     @property
     def mode(self) -> str:
-        """Returns 'rest' or 'commandlet'."""
-        return "rest" if self.rest_url else "commandlet"
+        """Returns 'rest' or 'commandlet' (commandlet while the breaker is open)."""
+        return "rest" if self.rest_url and not self._circuit_open() else "commandlet"
 
     @property
     def server_info(self) -> Optional[Dict[str, Any]]:
-        """Returns REST server info if connected, None otherwise."""
-        return self._server_info.copy() if self._server_info else None
+        """
+        Returns REST server info if connected, None otherwise.
+
+        The result is a copy; the parsed config itself is shared between
+        executors and must not be mutated.
+        """
+        return dict(self._server_info) if self._server_info else None
 
     def refresh_connection(self) -> bool:
         """
         Re-check for server availability.
 
+        Reuses the last discovery result if it is younger than DISCOVER_TTL
+        and no REST call has failed since.
+
         Returns:
             True if REST server is now available, False otherwise
         """
-        self._discover_server()
+        if time.monotonic() - self._last_discover_ts >= self.DISCOVER_TTL:
+            self._discover_server()
         return self.rest_url is not None
 
     def is_rest_available(self) -> bool:
-        """Check if REST mode is currently available."""
-        return self.rest_url is not None
+        """Check if REST mode is currently available (and not tripped)."""
+        return self.mode == "rest"
+
+
+def clear_discovery_cache() -> None:
+    """Forget discovery results shared between UnrealExecutor instances."""
+    _discovery_cache.clear()
+
+
+def _retry_policy(total: int, backoff: float) -> "Retry":
+    """Build the urllib3 retry policy for execute requests."""
+    kwargs = dict(
+        total=total,
+        # Never resend after a read error: the server may already have run the code
+        read=0,
+        backoff_factor=backoff,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["POST"]),
+        # Hand the last 5xx back instead of raising, so the breaker counts it
+        raise_on_status=False,
+    )
+    try:
+        return Retry(backoff_jitter=backoff / 2, **kwargs)
+    except TypeError:
+        # urllib3 < 2 has no jitter option
+        return Retry(**kwargs)
 
 
+@lru_cache(maxsize=8)
 def find_unreal_editor(engine_dir: Optional[str] = None) -> Optional[str]:
     """
     Find UnrealEditor-Cmd.exe path.
 
+    The result is cached per engine_dir for the life of the process (the
+    environment is read on the first call); use find_unreal_editor.cache_clear()
+    after installing an engine or changing UE_ROOT/PATH.
+
     Args:
         engine_dir: Optional specific engine directory to check
 
     Returns:
         Path to UnrealEditor-Cmd.exe or None if not found
     """
-    # Platform-specific executable name
-    if os.name == 'nt':
-        exe_name = "UnrealEditor-Cmd.exe"
-        relative_path = Path("Engine/Binaries/Win64") / exe_name
-    else:
-        exe_name = "UnrealEditor-Cmd"
-        relative_path = Path("Engine/Binaries/Linux") / exe_name
-
     candidates: List[Path] = []
 
     # Check specified engine directory first
     if engine_dir:
         engine_path = Path(engine_dir)
-        candidates.append(engine_path / relative_path)
+        candidates.append(engine_path / _REL_PATH)
         # Also check if engine_dir is the Binaries folder directly
-        candidates.append(engine_path / exe_name)
+        candidates.append(engine_path / _EXE_NAME)
 
     # Check environment variable
     ue_root = os.environ.get("UE_ROOT") or os.environ.get("UNREAL_ENGINE_ROOT")
     if ue_root:
-        candidates.append(Path(ue_root) / relative_path)
+        candidates.append(Path(ue_root) / _REL_PATH)
 
     # Check common installation locations on Windows
-    if os.name == 'nt':
+    if _IS_WIN:
         program_files = os.environ.get("ProgramFiles", "C:\\Program Files")
-        epic_games = Path(program_files) / "Epic Games"
+        epic_games = os.path.join(program_files, "Epic Games")
 
-        if epic_games.exists():
-            # Check for UE5.x installations
-            for ue_dir in epic_games.glob("UE_5.*"):
-                candidates.append(ue_dir / relative_path)
-            # Also check for source builds
-            for ue_dir in epic_games.glob("UnrealEngine*"):
-                candidates.append(ue_dir / relative_path)
+        # UE5.x installations first, then source builds; one directory read
+        # with case-insensitive prefix checks instead of two globs
+        installs: List[Path] = []
+        source_builds: List[Path] = []
+        try:
+            with os.scandir(epic_games) as it:
+                for entry in it:
+                    name = entry.name.lower()
+                    if name.startswith("ue_5."):
+                        target = installs
+                    elif name.startswith("unrealengine"):
+                        target = source_builds
+                    else:
+                        continue
+                    if entry.is_dir():
+                        target.append(Path(entry.path) / _REL_PATH)
+        except OSError:
+            pass
+        candidates += installs
+        candidates += source_builds
 
     # Check PATH
     path_dirs = os.environ.get("PATH", "").split(os.pathsep)
     for path_dir in path_dirs:
-        candidates.append(Path(path_dir) / exe_name)
+        candidates.append(Path(path_dir) / _EXE_NAME)
 
-    # Return first existing candidate
+    # Return first existing candidate (one stat each)
     for candidate in candidates:
-        if candidate.exists() and candidate.is_file():
+        if is_file(candidate):
             return str(candidate)
 
     return None
@@ -388,45 +579,106 @@ def parse_log_output_from_text(text: str, marker: str = "LogPython:") -> List[st
     Returns:
         List of log lines matching the marker
     """
-    lines = []
-    for line in text.splitlines():
-        if marker in line:
-            # Extract just the message part after the marker
-            idx = line.find(marker)
-            if idx >= 0:
-                msg = line[idx + len(marker):].strip()
-                # Remove common prefixes like "Display:", "Warning:", "Error:"
-                for prefix in ("Display: ", "Warning: ", "Error: "):
-                    if msg.startswith(prefix):
-                        msg = msg[len(prefix):]
-                        break
-                lines.append(msg)
-    return lines
+    # One regex pass finds the first marker on each line; non-matching
+    # lines are skipped without being split out
+    return [_clean_message(tail) for tail in _log_line_re(marker).findall(text)]
+
+
+# Line boundaries recognized by str.splitlines()
+_LINE_BREAKS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+
+@lru_cache(maxsize=8)
+def _log_line_re(marker: str) -> re.Pattern:
+    """Compile a pattern capturing the rest of the line after marker."""
+    return re.compile(f"{re.escape(marker)}([^{_LINE_BREAKS}]*)")
+
+
+def _clean_message(tail: str) -> str:
+    """Strip whitespace and a leading level prefix from a log message."""
+    msg = tail.strip()
+    # Remove common prefixes like "Display:", "Warning:", "Error:"
+    for prefix in ("Display: ", "Warning: ", "Error: "):
+        if msg.startswith(prefix):
+            return msg[len(prefix):]
+    return msg
+
+
+def _log_message(line: str, marker: str = "LogPython:") -> Optional[str]:
+    """Return the message after marker in a log line, or None if absent."""
+    idx = line.find(marker)
+    if idx < 0:
+        return None
+    return _clean_message(line[idx + len(marker):])
 
 
 def _indent_code(code: str, spaces: int) -> str:
-    """Indent all lines of code by specified spaces."""
-    indent = " " * spaces
-    lines = code.splitlines()
-    return "\n".join(indent + line if line.strip() else line for line in lines)
+    """Indent all non-blank lines of code by specified spaces."""
+    # splitlines() normalizes CRLF (the script is written in text mode) and
+    # drops a trailing newline, as the wrapper template expects
+    return textwrap.indent("\n".join(code.splitlines()), " " * spaces, str.strip)
 
 
-def _extract_marked_output(text: str) -> str:
-    """Extract output between start/end markers."""
-    start_marker = "<<<UNREAL_PYTHON_OUTPUT_START>>>"
-    end_marker = "<<<UNREAL_PYTHON_OUTPUT_END>>>"
+def _python_log_lines(raw_lines: Iterable[bytes]) -> Iterator[str]:
+    """
+    Decode only the raw output lines the commandlet parser can use.
+
+    Engine startup logs thousands of lines; those without a LogPython tag
+    or an output marker are skipped as bytes and never decoded.
+    """
+    for raw in raw_lines:
+        if _LOG_TAG_B in raw or _MARKER_START_B in raw or _MARKER_END_B in raw:
+            yield raw.decode("utf-8", errors="replace")
+
+
+def _parse_commandlet_lines(lines: Iterable[str]) -> Tuple[List[str], str]:
+    """
+    Extract Python log lines and the marked output in one pass.
 
-    start_idx = text.find(start_marker)
-    end_idx = text.find(end_marker)
+    Consumes lines as they arrive, so it can read a live process pipe.
 
-    if start_idx >= 0 and end_idx > start_idx:
-        # Extract content between markers
-        content = text[start_idx + len(start_marker):end_idx]
-        # Parse out just the Python log messages
-        lines = parse_log_output_from_text(content)
-        return "\n".join(lines)
+    Args:
+        lines: Commandlet output lines (trailing newlines are ignored)
 
-    return ""
+    Returns:
+        (logs, output): every LogPython message, and the messages logged
+        between the start/end markers joined by newlines ("" if the markers
+        are missing or out of order)
+    """
+    logs: List[str] = []
+    marked: List[str] = []
+    started = finished = False
+    for line in lines:
+        msg = _log_message(line)
+        if msg is not None:
+            logs.append(msg)
+        if finished:
+            continue
+
+        if started:
+            fragment = line
+        else:
+            match = _MARKER_RE.search(line)
+            if match is None:
+                continue
+            if match.group() == _MARKER_END:
+                # End marker before the start marker: no valid output
+                finished = True
+                continue
+            started = True
+            fragment = line[match.end():]
+
+        end_idx = fragment.find(_MARKER_END)
+        if end_idx >= 0:
+            fragment = fragment[:end_idx]
+            finished = True
+        msg = _log_message(fragment)
+        if msg is not None:
+            marked.append(msg)
+
+    if not (started and finished):
+        return logs, ""
+    return logs, "\n".join(marked)
 
 
 if __name__ == "__main__":
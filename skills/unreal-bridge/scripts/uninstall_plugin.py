@@ -9,36 +9,34 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import shutil
 import sys
 from pathlib import Path
 from typing import Dict, Any
 
-from ue_project_utils import find_uproject_file, write_uproject
+from ue_project_utils import find_uproject_file, read_uproject, write_uproject
 
 
 def remove_plugin_from_uproject(uproject_path: Path) -> bool:
     """Remove UnrealPythonREST from .uproject plugins list."""
     try:
-        with open(uproject_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_uproject(uproject_path)
 
-        if "Plugins" not in data:
+        plugins = data.get("Plugins")
+        if not plugins:
             return True
 
-        # Filter out UnrealPythonREST
-        original_count = len(data["Plugins"])
+        # Nothing to remove: skip rebuilding the list and rewriting the file
+        if not any(p.get("Name") == "UnrealPythonREST" for p in plugins):
+            return True
+
+        # Filter out UnrealPythonREST (every entry, in case it is listed twice)
         data["Plugins"] = [
-            p for p in data["Plugins"]
+            p for p in plugins
             if p.get("Name") != "UnrealPythonREST"
         ]
-
-        if len(data["Plugins"]) < original_count:
-            write_uproject(uproject_path, data)
-            return True
-
-        return True  # Nothing to remove
+        write_uproject(uproject_path, data)
+        return True
 
     except Exception as e:
         print(f"Error updating .uproject: {e}")